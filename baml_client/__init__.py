@@ -1,19 +1,16 @@
-###############################################################################
+# ----------------------------------------------------------------------------
 #
 #  Welcome to Baml! To use this generated code, please run the following:
 #
-#  $ pip install baml-py
+#  $ pip install baml
 #
-###############################################################################
+# ----------------------------------------------------------------------------
 
 # This file was generated by BAML: please do not edit it. Instead, edit the
-# BAML files and re-generate this code.
-#
-# ruff: noqa: E501,F401
-# flake8: noqa: E501,F401
-# pylint: disable=unused-import,line-too-long
-# fmt: off
-__version__ = "0.90.2"
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+__version__ = "0.226.2"
 
 try:
   from baml_py.safe_import import EnsureBamlPyImport
@@ -32,23 +29,32 @@ https://github.com/boundaryml/baml/issues
 https://boundaryml.com/discord
 """) from None
 
+
 with EnsureBamlPyImport(__version__) as e:
   e.raise_if_incompatible_version(__version__)
 
   from . import types
   from . import tracing
-  from . import partial_types
+  from . import stream_types
   from . import config
   from .config import reset_baml_env_vars
   
   from .async_client import b
   
+  from . import watchers
+
+
+# FOR LEGACY COMPATIBILITY, expose "partial_types" as an alias for "stream_types"
+# WE RECOMMEND USERS TO USE "stream_types" INSTEAD
+partial_types = stream_types
 
 __all__ = [
   "b",
+  "stream_types",
   "partial_types",
   "tracing",
   "types",
   "reset_baml_env_vars",
   "config",
+  "watchers",
 ]
\ No newline at end of file
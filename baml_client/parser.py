@@ -1,105 +1,46 @@
-###############################################################################
+# ----------------------------------------------------------------------------
 #
 #  Welcome to Baml! To use this generated code, please run the following:
 #
-#  $ pip install baml-py
+#  $ pip install baml
 #
-###############################################################################
+# ----------------------------------------------------------------------------
 
 # This file was generated by BAML: please do not edit it. Instead, edit the
-# BAML files and re-generate this code.
-#
-# ruff: noqa: E501,F401
-# flake8: noqa: E501,F401
-# pylint: disable=unused-import,line-too-long
-# fmt: off
-from typing import Dict, List, Optional, Union, cast
-from typing_extensions import Literal
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
 
-import baml_py
+import typing
+import typing_extensions
 
-from . import _baml
-from .types import Checked, Check
 
+from . import stream_types, types
+from .runtime import DoNotUseDirectlyCallManager, BamlCallOptions
 
 class LlmResponseParser:
-    __runtime: baml_py.BamlRuntime
-    __ctx_manager: baml_py.BamlCtxManager
+    __options: DoNotUseDirectlyCallManager
 
-    def __init__(self, runtime: baml_py.BamlRuntime, ctx_manager: baml_py.BamlCtxManager):
-      self.__runtime = runtime
-      self.__ctx_manager = ctx_manager
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
 
-    
     def EditCode(
-        self,
-        llm_response: str,
-        baml_options: _baml.BamlCallOptionsModApi = {},
-    ) -> _baml.types.CodeChanges:
-      __tb__ = baml_options.get("tb", None)
-      if __tb__ is not None:
-        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
-      else:
-        tb = None
-      __cr__ = baml_options.get("client_registry", None)
-
-      env = _baml.env_vars_to_dict(baml_options.get("env", {}))
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.CodeChanges:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="EditCode", llm_response=llm_response, mode="request")
+        return typing.cast(types.CodeChanges, __result__)
 
-      parsed = self.__runtime.parse_llm_response(
-        "EditCode",
-        llm_response,
-        _baml.types,
-        _baml.types,
-        _baml.partial_types,
-        False,
-        self.__ctx_manager.get(),
-        tb,
-        __cr__,
-        env,
-      )
-
-      return cast(_baml.types.CodeChanges, parsed)
     
 
-
 class LlmStreamParser:
-    __runtime: baml_py.BamlRuntime
-    __ctx_manager: baml_py.BamlCtxManager
+    __options: DoNotUseDirectlyCallManager
 
-    def __init__(self, runtime: baml_py.BamlRuntime, ctx_manager: baml_py.BamlCtxManager):
-      self.__runtime = runtime
-      self.__ctx_manager = ctx_manager
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
 
-    
     def EditCode(
-        self,
-        llm_response: str,
-        baml_options: _baml.BamlCallOptionsModApi = {},
-    ) -> _baml.partial_types.CodeChanges:
-      __tb__ = baml_options.get("tb", None)
-      if __tb__ is not None:
-        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
-      else:
-        tb = None
-      __cr__ = baml_options.get("client_registry", None)
-
-      env = _baml.env_vars_to_dict(baml_options.get("env", {}))
-
-      parsed = self.__runtime.parse_llm_response(
-        "EditCode",
-        llm_response,
-        _baml.types,
-        _baml.types,
-        _baml.partial_types,
-        True,
-        self.__ctx_manager.get(),
-        tb,
-        __cr__,
-        env,
-      )
-
-      return cast(_baml.partial_types.CodeChanges, parsed)
-    
-
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.CodeChanges:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="EditCode", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.CodeChanges, __result__)
 
-__all__ = ["LlmResponseParser", "LlmStreamParser"]
\ No newline at end of file
+    
\ No newline at end of file
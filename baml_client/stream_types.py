@@ -0,0 +1,67 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+from pydantic import BaseModel, ConfigDict, Field
+
+import baml_py
+
+from . import types
+
+StreamStateValueT = typing.TypeVar('StreamStateValueT')
+class StreamState(BaseModel, typing.Generic[StreamStateValueT]):
+    value: StreamStateValueT
+    state: typing_extensions.Literal["Pending", "Incomplete", "Complete"]
+# #########################################################################
+# Generated classes (5)
+# #########################################################################
+
+class CodeChanges(BaseModel):
+    plan: StreamState[typing.Optional[str]]
+    files: typing.List["types.File"]
+    edits: typing.List["types.FileEdit"]
+    package_json: typing.Optional[str] = None
+
+class File(BaseModel):
+    path: str
+    content: str
+
+class FileEdit(BaseModel):
+    path: str
+    hunks: typing.List["types.Hunk"]
+
+class Hunk(BaseModel):
+    search: typing.Optional[str] = None
+    replace: typing.Optional[str] = None
+
+class Message(BaseModel):
+    role: typing.Optional[str] = None
+    content: typing.Optional[str] = None
+
+# #########################################################################
+# Generated type aliases (0)
+# #########################################################################
+
+
+# #########################################################################
+# Model rebuilds (5)
+# #########################################################################
+# Resolve string forward references now that every model above is defined so
+# class declaration order never breaks Pydantic construction (issue #793).
+# Recursive models are intentionally omitted (Pydantic resolves those lazily;
+# eagerly rebuilding them can recurse).
+CodeChanges.model_rebuild()
+File.model_rebuild()
+FileEdit.model_rebuild()
+Hunk.model_rebuild()
+Message.model_rebuild()
@@ -1,53 +1,78 @@
-###############################################################################
+# ----------------------------------------------------------------------------
 #
 #  Welcome to Baml! To use this generated code, please run the following:
 #
-#  $ pip install baml-py
+#  $ pip install baml
 #
-###############################################################################
+# ----------------------------------------------------------------------------
 
 # This file was generated by BAML: please do not edit it. Instead, edit the
-# BAML files and re-generate this code.
-#
-# ruff: noqa: E501,F401
-# flake8: noqa: E501,F401
-# pylint: disable=unused-import,line-too-long
-# fmt: off
-from typing import Dict, List, Optional, TypeVar, Union, cast
-from typing_extensions import Literal
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
 
+import typing
+import typing_extensions
 import baml_py
 
-from . import _baml
-from ._baml import BamlCallOptions
-from .types import Checked, Check
+from . import stream_types, types, type_builder
 from .parser import LlmResponseParser, LlmStreamParser
-from .sync_request import HttpRequest, HttpStreamRequest
-from .globals import DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_CTX, DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME
-
-
-OutputType = TypeVar('OutputType')
-
+from .runtime import DoNotUseDirectlyCallManager, BamlCallOptions
+from .globals import DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME as __runtime__
 
 class BamlSyncClient:
-    __runtime: baml_py.BamlRuntime
-    __ctx_manager: baml_py.BamlCtxManager
+    __options: DoNotUseDirectlyCallManager
     __stream_client: "BamlStreamClient"
-    __http_request: HttpRequest
-    __http_stream_request: HttpStreamRequest
+    __http_request: "BamlHttpRequestClient"
+    __http_stream_request: "BamlHttpStreamRequestClient"
     __llm_response_parser: LlmResponseParser
     __llm_stream_parser: LlmStreamParser
-    __baml_options: _baml.BamlCallOptions
-
-    def __init__(self, runtime: baml_py.BamlRuntime, ctx_manager: baml_py.BamlCtxManager, baml_options: Optional[_baml.BamlCallOptions] = None):
-      self.__runtime = runtime
-      self.__ctx_manager = ctx_manager
-      self.__stream_client = BamlStreamClient(self.__runtime, self.__ctx_manager, baml_options)
-      self.__http_request = HttpRequest(self.__runtime, self.__ctx_manager)
-      self.__http_stream_request = HttpStreamRequest(self.__runtime, self.__ctx_manager)
-      self.__llm_response_parser = LlmResponseParser(self.__runtime, self.__ctx_manager)
-      self.__llm_stream_parser = LlmStreamParser(self.__runtime, self.__ctx_manager)
-      self.__baml_options = baml_options or {}
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+        self.__stream_client = BamlStreamClient(options)
+        self.__http_request = BamlHttpRequestClient(options)
+        self.__http_stream_request = BamlHttpStreamRequestClient(options)
+        self.__llm_response_parser = LlmResponseParser(options)
+        self.__llm_stream_parser = LlmStreamParser(options)
+
+    def __getstate__(self):
+        # Return state needed for pickling
+        return {"options": self.__options}
+
+    def __setstate__(self, state):
+        # Restore state from pickling
+        self.__options = state["options"]
+        self.__stream_client = BamlStreamClient(self.__options)
+        self.__http_request = BamlHttpRequestClient(self.__options)
+        self.__http_stream_request = BamlHttpStreamRequestClient(self.__options)
+        self.__llm_response_parser = LlmResponseParser(self.__options)
+        self.__llm_stream_parser = LlmStreamParser(self.__options)
+
+    def with_options(self,
+        tb: typing.Optional[type_builder.TypeBuilder] = None,
+        client_registry: typing.Optional[baml_py.baml_py.ClientRegistry] = None,
+        client: typing.Optional[str] = None,
+        collector: typing.Optional[typing.Union[baml_py.baml_py.Collector, typing.List[baml_py.baml_py.Collector]]] = None,
+        env: typing.Optional[typing.Dict[str, typing.Optional[str]]] = None,
+        tags: typing.Optional[typing.Dict[str, str]] = None,
+        on_tick: typing.Optional[typing.Callable[[str, baml_py.baml_py.FunctionLog], None]] = None,
+    ) -> "BamlSyncClient":
+        options: BamlCallOptions = {}
+        if tb is not None:
+            options["tb"] = tb
+        if client_registry is not None:
+            options["client_registry"] = client_registry
+        if client is not None:
+            options["client"] = client
+        if collector is not None:
+            options["collector"] = collector
+        if env is not None:
+            options["env"] = env
+        if tags is not None:
+            options["tags"] = tags
+        if on_tick is not None:
+            options["on_tick"] = on_tick
+        return BamlSyncClient(self.__options.merge_options(options))
 
     @property
     def stream(self):
@@ -69,112 +94,71 @@ class BamlSyncClient:
     def parse_stream(self):
       return self.__llm_stream_parser
 
-    def with_options(
-      self,
-      tb: Optional[_baml.type_builder.TypeBuilder] = None,
-      client_registry: Optional[baml_py.baml_py.ClientRegistry] = None,
-      collector: Optional[Union[baml_py.baml_py.Collector, List[baml_py.baml_py.Collector]]] = None,
-      env: Optional[Dict[str, str]] = None,
-    ) -> "BamlSyncClient":
-      """
-      Returns a new instance of BamlSyncClient with explicitly typed baml options
-      for Python 3.8 compatibility.
-      """
-      new_options: _baml.BamlCallOptions = self.__baml_options.copy()
-
-      # Override if any keyword arguments were provided.
-      if tb is not None:
-          new_options["tb"] = tb
-      if client_registry is not None:
-          new_options["client_registry"] = client_registry
-      if collector is not None:
-          new_options["collector"] = collector
-      if env is not None:
-          new_options["env"] = env
-      return BamlSyncClient(self.__runtime, self.__ctx_manager, new_options)
-
+    def EditCode(self, history: typing.List["types.Message"],feedback: str,code_files: typing.List["types.File"],package_json: str,
+        baml_options: BamlCallOptions = {},
+    ) -> types.CodeChanges:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            __stream__ = self.stream.EditCode(history=history,feedback=feedback,code_files=code_files,package_json=package_json,
+                baml_options=baml_options)
+            return __stream__.get_final_response()
+        else:
+            # Original non-streaming code
+            __result__ = self.__options.merge_options(baml_options).call_function_sync(function_name="EditCode", args={
+                "history": history,"feedback": feedback,"code_files": code_files,"package_json": package_json,
+            })
+            return typing.cast(types.CodeChanges, __result__.cast_to(types, types, stream_types, False, __runtime__))
     
-    def EditCode(
-        self,
-        history: List[_baml.types.Message],feedback: str,code_files: List[_baml.types.File],package_json: str,
-        baml_options: _baml.BamlCallOptions = {},
-    ) -> _baml.types.CodeChanges:
-      options: _baml.BamlCallOptions = {**self.__baml_options, **(baml_options or {})}
-      __tb__ = options.get("tb", None)
-      if __tb__ is not None:
-        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
-      else:
-        tb = None
-      __cr__ = options.get("client_registry", None)
-      collector = options.get("collector", None)
-      collectors = collector if isinstance(collector, list) else [collector] if collector is not None else []
-      env = _baml.env_vars_to_dict(options.get("env", {}))
-      raw = self.__runtime.call_function_sync(
-        "EditCode",
-        {
-          "history": history,"feedback": feedback,"code_files": code_files,"package_json": package_json,
-        },
-        self.__ctx_manager.get(),
-        tb,
-        __cr__,
-        collectors,
-        env,
-      )
-      return cast(_baml.types.CodeChanges, raw.cast_to(_baml.types, _baml.types, _baml.partial_types, False))
-    
-
 
 
 class BamlStreamClient:
-    __runtime: baml_py.BamlRuntime
-    __ctx_manager: baml_py.BamlCtxManager
-    __baml_options: _baml.BamlCallOptions
-    def __init__(self, runtime: baml_py.BamlRuntime, ctx_manager: baml_py.BamlCtxManager, baml_options: Optional[_baml.BamlCallOptions] = None):
-      self.__runtime = runtime
-      self.__ctx_manager = ctx_manager
-      self.__baml_options = baml_options or {}
-
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def EditCode(self, history: typing.List["types.Message"],feedback: str,code_files: typing.List["types.File"],package_json: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[stream_types.CodeChanges, types.CodeChanges]:
+        __ctx__, __result__ = self.__options.merge_options(baml_options).create_sync_stream(function_name="EditCode", args={
+            "history": history,"feedback": feedback,"code_files": code_files,"package_json": package_json,
+        })
+        return baml_py.BamlSyncStream[stream_types.CodeChanges, types.CodeChanges](
+          __result__,
+          lambda x: typing.cast(stream_types.CodeChanges, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.CodeChanges, x.cast_to(types, types, stream_types, False, __runtime__)),
+          __ctx__,
+        )
     
-    def EditCode(
-        self,
-        history: List[_baml.types.Message],feedback: str,code_files: List[_baml.types.File],package_json: str,
-        baml_options: _baml.BamlCallOptions = {},
-    ) -> baml_py.BamlSyncStream[_baml.partial_types.CodeChanges, _baml.types.CodeChanges]:
-      options: _baml.BamlCallOptions = {**self.__baml_options, **(baml_options or {})}
-      __tb__ = options.get("tb", None)
-      if __tb__ is not None:
-        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
-      else:
-        tb = None
-      __cr__ = options.get("client_registry", None)
-      collector = options.get("collector", None)
-      collectors = collector if isinstance(collector, list) else [collector] if collector is not None else []
-      env = _baml.env_vars_to_dict(options.get("env", {}))
-      raw = self.__runtime.stream_function_sync(
-        "EditCode",
-        {
-          "history": history,
-          "feedback": feedback,
-          "code_files": code_files,
-          "package_json": package_json,
-        },
-        None,
-        self.__ctx_manager.get(),
-        tb,
-        __cr__,
-        collectors,
-        env,
-      )
-
-      return baml_py.BamlSyncStream[_baml.partial_types.CodeChanges, _baml.types.CodeChanges](
-        raw,
-        lambda x: cast(_baml.partial_types.CodeChanges, x.cast_to(_baml.types, _baml.types, _baml.partial_types, True)),
-        lambda x: cast(_baml.types.CodeChanges, x.cast_to(_baml.types, _baml.types, _baml.partial_types, False)),
-        self.__ctx_manager.get(),
-      )
+
+class BamlHttpRequestClient:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def EditCode(self, history: typing.List["types.Message"],feedback: str,code_files: typing.List["types.File"],package_json: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        __result__ = self.__options.merge_options(baml_options).create_http_request_sync(function_name="EditCode", args={
+            "history": history,"feedback": feedback,"code_files": code_files,"package_json": package_json,
+        }, mode="request")
+        return __result__
     
 
+class BamlHttpStreamRequestClient:
+    __options: DoNotUseDirectlyCallManager
 
-b = BamlSyncClient(DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME, DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_CTX)
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def EditCode(self, history: typing.List["types.Message"],feedback: str,code_files: typing.List["types.File"],package_json: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        __result__ = self.__options.merge_options(baml_options).create_http_request_sync(function_name="EditCode", args={
+            "history": history,"feedback": feedback,"code_files": code_files,"package_json": package_json,
+        }, mode="stream")
+        return __result__
+    
 
-__all__ = ["b", "BamlCallOptions"]
\ No newline at end of file
+b = BamlSyncClient(DoNotUseDirectlyCallManager({}))
\ No newline at end of file
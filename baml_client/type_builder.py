@@ -1,57 +1,78 @@
-###############################################################################
+# ----------------------------------------------------------------------------
 #
 #  Welcome to Baml! To use this generated code, please run the following:
 #
-#  $ pip install baml-py
+#  $ pip install baml
 #
-###############################################################################
+# ----------------------------------------------------------------------------
 
 # This file was generated by BAML: please do not edit it. Instead, edit the
-# BAML files and re-generate this code.
-#
-# ruff: noqa: E501,F401
-# flake8: noqa: E501,F401
-# pylint: disable=unused-import,line-too-long
-# fmt: off
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
 import typing
-from baml_py.baml_py import FieldType, EnumValueBuilder, EnumBuilder, ClassBuilder
-from baml_py.type_builder import TypeBuilder as _TypeBuilder, ClassPropertyBuilder, ClassPropertyViewer, EnumValueViewer
+from baml_py import type_builder
+from baml_py import baml_py
+# These are exports, not used here, hence the linter is disabled
+from baml_py.baml_py import FieldType, EnumValueBuilder, EnumBuilder, ClassBuilder # noqa: F401 # pylint: disable=unused-import
 from .globals import DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME
 
-
-class TypeBuilder(_TypeBuilder):
+class TypeBuilder(type_builder.TypeBuilder):
     def __init__(self):
         super().__init__(classes=set(
-          ["CodeChanges","File","Message",]
+          ["CodeChanges","File","FileEdit","Hunk","Message",]
         ), enums=set(
           []
         ), runtime=DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME)
 
+    # #########################################################################
+    # Generated enums 0
+    # #########################################################################
+
+
+    # #########################################################################
+    # Generated classes 5
+    # #########################################################################
 
     @property
-    def CodeChanges(self) -> "CodeChangesAst":
-        return CodeChangesAst(self)
+    def CodeChanges(self) -> "CodeChangesViewer":
+        return CodeChangesViewer(self)
 
     @property
-    def File(self) -> "FileAst":
-        return FileAst(self)
+    def File(self) -> "FileViewer":
+        return FileViewer(self)
 
     @property
-    def Message(self) -> "MessageAst":
-        return MessageAst(self)
+    def FileEdit(self) -> "FileEditViewer":
+        return FileEditViewer(self)
+
+    @property
+    def Hunk(self) -> "HunkViewer":
+        return HunkViewer(self)
+
+    @property
+    def Message(self) -> "MessageViewer":
+        return MessageViewer(self)
 
 
 
+# #########################################################################
+# Generated enums 0
+# #########################################################################
 
 
+# #########################################################################
+# Generated classes 5
+# #########################################################################
+
 class CodeChangesAst:
-    def __init__(self, tb: _TypeBuilder):
+    def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
         self._bldr = _tb.class_("CodeChanges")
-        self._properties: typing.Set[str] = set([ "plan",  "files",  "package_json", ])
+        self._properties: typing.Set[str] = set([  "plan",  "files",  "edits",  "package_json",  ])
         self._props = CodeChangesProperties(self._bldr, self._properties)
 
-    def type(self) -> FieldType:
+    def type(self) -> baml_py.FieldType:
         return self._bldr.field()
 
     @property
@@ -60,44 +81,49 @@ class CodeChangesAst:
 
 
 class CodeChangesViewer(CodeChangesAst):
-    def __init__(self, tb: _TypeBuilder):
+    def __init__(self, tb: type_builder.TypeBuilder):
         super().__init__(tb)
 
     
-    def list_properties(self) -> typing.List[typing.Tuple[str, ClassPropertyViewer]]:
-        return [(name, ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
-
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
 
 
 class CodeChangesProperties:
-    def __init__(self, bldr: ClassBuilder, properties: typing.Set[str]):
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
         self.__bldr = bldr
-        self.__properties = properties
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
 
     
-
+    
     @property
-    def plan(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("plan"))
-
+    def plan(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("plan"))
+    
     @property
-    def files(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("files"))
-
+    def files(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("files"))
+    
     @property
-    def package_json(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("package_json"))
-
+    def edits(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("edits"))
+    
+    @property
+    def package_json(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("package_json"))
+    
     
 
+
 class FileAst:
-    def __init__(self, tb: _TypeBuilder):
+    def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
         self._bldr = _tb.class_("File")
-        self._properties: typing.Set[str] = set([ "path",  "content", ])
+        self._properties: typing.Set[str] = set([  "path",  "content",  ])
         self._props = FileProperties(self._bldr, self._properties)
 
-    def type(self) -> FieldType:
+    def type(self) -> baml_py.FieldType:
         return self._bldr.field()
 
     @property
@@ -106,40 +132,127 @@ class FileAst:
 
 
 class FileViewer(FileAst):
-    def __init__(self, tb: _TypeBuilder):
+    def __init__(self, tb: type_builder.TypeBuilder):
         super().__init__(tb)
 
     
-    def list_properties(self) -> typing.List[typing.Tuple[str, ClassPropertyViewer]]:
-        return [(name, ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
-
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
 
 
 class FileProperties:
-    def __init__(self, bldr: ClassBuilder, properties: typing.Set[str]):
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
         self.__bldr = bldr
-        self.__properties = properties
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
 
     
+    
+    @property
+    def path(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("path"))
+    
+    @property
+    def content(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("content"))
+    
+    
+
+
+class FileEditAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("FileEdit")
+        self._properties: typing.Set[str] = set([  "path",  "hunks",  ])
+        self._props = FileEditProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
 
     @property
-    def path(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("path"))
+    def props(self) -> "FileEditProperties":
+        return self._props
+
+
+class FileEditViewer(FileEditAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
+
+
+class FileEditProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    
+    
+    @property
+    def path(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("path"))
+    
+    @property
+    def hunks(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("hunks"))
+    
+    
+
+
+class HunkAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("Hunk")
+        self._properties: typing.Set[str] = set([  "search",  "replace",  ])
+        self._props = HunkProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
 
     @property
-    def content(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("content"))
+    def props(self) -> "HunkProperties":
+        return self._props
+
 
+class HunkViewer(HunkAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
     
 
+
+class HunkProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    
+    
+    @property
+    def search(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("search"))
+    
+    @property
+    def replace(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("replace"))
+    
+    
+
+
 class MessageAst:
-    def __init__(self, tb: _TypeBuilder):
+    def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
         self._bldr = _tb.class_("Message")
-        self._properties: typing.Set[str] = set([ "role",  "content", ])
+        self._properties: typing.Set[str] = set([  "role",  "content",  ])
         self._props = MessageProperties(self._bldr, self._properties)
 
-    def type(self) -> FieldType:
+    def type(self) -> baml_py.FieldType:
         return self._bldr.field()
 
     @property
@@ -148,33 +261,29 @@ class MessageAst:
 
 
 class MessageViewer(MessageAst):
-    def __init__(self, tb: _TypeBuilder):
+    def __init__(self, tb: type_builder.TypeBuilder):
         super().__init__(tb)
 
     
-    def list_properties(self) -> typing.List[typing.Tuple[str, ClassPropertyViewer]]:
-        return [(name, ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
-
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
 
 
 class MessageProperties:
-    def __init__(self, bldr: ClassBuilder, properties: typing.Set[str]):
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
         self.__bldr = bldr
-        self.__properties = properties
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
 
     
-
+    
     @property
-    def role(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("role"))
-
+    def role(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("role"))
+    
     @property
-    def content(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("content"))
-
+    def content(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("content"))
+    
     
 
-
-
-
-__all__ = ["TypeBuilder"]
\ No newline at end of file
@@ -0,0 +1,35 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+from . import types
+from . import stream_types
+
+
+type_map = {
+
+    "types.CodeChanges": types.CodeChanges,
+    "stream_types.CodeChanges": stream_types.CodeChanges,
+
+    "types.File": types.File,
+    "stream_types.File": stream_types.File,
+
+    "types.FileEdit": types.FileEdit,
+    "stream_types.FileEdit": stream_types.FileEdit,
+
+    "types.Hunk": types.Hunk,
+    "stream_types.Hunk": stream_types.Hunk,
+
+    "types.Message": types.Message,
+    "stream_types.Message": stream_types.Message,
+
+
+}
\ No newline at end of file
@@ -1,55 +1,85 @@
-###############################################################################
+# ----------------------------------------------------------------------------
 #
 #  Welcome to Baml! To use this generated code, please run the following:
 #
-#  $ pip install baml-py
+#  $ pip install baml
 #
-###############################################################################
+# ----------------------------------------------------------------------------
 
 # This file was generated by BAML: please do not edit it. Instead, edit the
-# BAML files and re-generate this code.
-#
-# ruff: noqa: E501,F401
-# flake8: noqa: E501,F401
-# pylint: disable=unused-import,line-too-long
-# fmt: off
-import baml_py
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
 from enum import Enum
 
-from pydantic import BaseModel, ConfigDict
 
-from typing_extensions import TypeAlias, Literal
-from typing import Dict, Generic, List, Optional, TypeVar, Union
+from pydantic import BaseModel, ConfigDict, Field
 
 
-T = TypeVar('T')
-CheckName = TypeVar('CheckName', bound=str)
+import baml_py
+
+CheckT = typing_extensions.TypeVar('CheckT')
+CheckName = typing_extensions.TypeVar('CheckName', bound=str)
 
 class Check(BaseModel):
     name: str
     expression: str
     status: str
-class Checked(BaseModel, Generic[T,CheckName]):
-    value: T
-    checks: Dict[CheckName, Check]
+class Checked(BaseModel, typing.Generic[CheckT, CheckName]):
+    value: CheckT
+    checks: typing.Dict[CheckName, Check]
 
-def get_checks(checks: Dict[CheckName, Check]) -> List[Check]:
+def get_checks(checks: typing.Dict[CheckName, Check]) -> typing.List[Check]:
     return list(checks.values())
 
-def all_succeeded(checks: Dict[CheckName, Check]) -> bool:
+def all_succeeded(checks: typing.Dict[CheckName, Check]) -> bool:
     return all(check.status == "succeeded" for check in get_checks(checks))
+# #########################################################################
+# Generated enums (0)
+# #########################################################################
 
-
+# #########################################################################
+# Generated classes (5)
+# #########################################################################
 
 class CodeChanges(BaseModel):
     plan: str
-    files: List["File"]
+    files: typing.List["File"]
+    edits: typing.List["FileEdit"]
     package_json: str
 
 class File(BaseModel):
     path: str
     content: str
 
+class FileEdit(BaseModel):
+    path: str
+    hunks: typing.List["Hunk"]
+
+class Hunk(BaseModel):
+    search: str
+    replace: str
+
 class Message(BaseModel):
     role: str
     content: str
+
+# #########################################################################
+# Generated type aliases (0)
+# #########################################################################
+
+
+# #########################################################################
+# Model rebuilds (5)
+# #########################################################################
+# Resolve string forward references now that every model above is defined so
+# class declaration order never breaks Pydantic construction (issue #793).
+# Recursive models are intentionally omitted (Pydantic resolves those lazily;
+# eagerly rebuilding them can recurse).
+CodeChanges.model_rebuild()
+File.model_rebuild()
+FileEdit.model_rebuild()
+Hunk.model_rebuild()
+Message.model_rebuild()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Prompt-size measurement for EditCode's context selection on a realistic
+project: a Vite + shadcn/ui app with the usual components/ui library, a few
+pages and feature components. For each feedback it compares sending every
+file (the old behaviour) against the selected files plus path-only
+placeholders for the rest, and times the selection itself.
+Token counts use the same estimate as the router. With --live it also measures
+EditCode's time to first token for both prompts against the real model
+(needs OPENAI_API_KEY), aborting each request after its first partial. Set
+BAML_LOG=warn to keep BAML's request logs out of the table.
+"""
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+
+from baml_py import AbortController
+
+from baml_client.async_client import b
+from src.context import (
+    ImportGraph,
+    context_files,
+    edit_targets,
+    estimate_tokens,
+    select_context,
+)
+from src.router import client_registry, route_edit
+
+ROOT = "/app/src"
+PACKAGE_JSON = (
+    '{"dependencies": {"react": "^18.3.1", "react-dom": "^18.3.1", '
+    '"react-router-dom": "^6.26.2", "lucide-react": "^0.462.0", '
+    '"recharts": "^2.12.7", "tailwind-merge": "^2.5.2"}}'
+)
+LIVE = "--live" in sys.argv
+# Time-to-first-token samples per prompt; the median is reported
+LIVE_SAMPLES = 3
+# The shadcn/ui components a generated project typically ships, with rough
+# source sizes in bytes
+UI_COMPONENTS = {
+    "accordion": 2100,
+    "alert": 1600,
+    "alert-dialog": 4400,
+    "aspect-ratio": 200,
+    "avatar": 1400,
+    "badge": 1100,
+    "breadcrumb": 2700,
+    "button": 1900,
+    "calendar": 2600,
+    "card": 1900,
+    "carousel": 6200,
+    "chart": 10500,
+    "checkbox": 1100,
+    "collapsible": 300,
+    "command": 4900,
+    "context-menu": 7300,
+    "dialog": 3900,
+    "drawer": 3000,
+    "dropdown-menu": 7400,
+    "form": 4100,
+    "hover-card": 1200,
+    "input": 800,
+    "input-otp": 2200,
+    "label": 700,
+    "menubar": 8000,
+    "navigation-menu": 5100,
+    "pagination": 2800,
+    "popover": 1300,
+    "progress": 800,
+    "radio-group": 1500,
+    "resizable": 1700,
+    "scroll-area": 1700,
+    "select": 5700,
+    "separator": 800,
+    "sheet": 4300,
+    "sidebar": 23000,
+    "skeleton": 300,
+    "slider": 1100,
+    "sonner": 900,
+    "switch": 1200,
+    "table": 2800,
+    "tabs": 1900,
+    "textarea": 800,
+    "toast": 4900,
+    "toaster": 800,
+    "toggle": 1500,
+    "toggle-group": 1800,
+    "tooltip": 1200,
+}
+# Feature files: path -> (imports, size in bytes)
+FEATURES = {
+    "main.tsx": (["App"], 300),
+    "App.tsx": (
+        ["pages/Home", "pages/Dashboard", "pages/Settings", "components/ui/toaster"],
+        1800,
+    ),
+    "lib/utils.ts": ([], 200),
+    "hooks/use-toast.ts": ([], 3900),
+    "hooks/use-mobile.tsx": ([], 600),
+    "components/Header.tsx": (
+        ["components/ui/button", "components/ui/avatar", "components/ui/dropdown-menu"],
+        2600,
+    ),
+    "components/Footer.tsx": (["components/ui/separator"], 1200),
+    "components/AppSidebar.tsx": (["components/ui/sidebar"], 2800),
+    "components/StatsCard.tsx": (["components/ui/card", "components/ui/badge"], 1500),
+    "components/RevenueChart.tsx": (["components/ui/card", "components/ui/chart"], 3400),
+    "components/UsersTable.tsx": (
+        ["components/ui/table", "components/ui/badge", "components/ui/pagination"],
+        4200,
+    ),
+    "components/ProfileForm.tsx": (
+        ["components/ui/form", "components/ui/input", "components/ui/button"],
+        3800,
+    ),
+    "pages/Home.tsx": (["components/Header", "components/Footer"], 3500),
+    "pages/Dashboard.tsx": (
+        [
+            "components/AppSidebar",
+            "components/StatsCard",
+            "components/RevenueChart",
+            "components/UsersTable",
+        ],
+        2900,
+    ),
+    "pages/Settings.tsx": (["components/ProfileForm", "components/ui/tabs"], 2200),
+}
+FEEDBACK = [
+    "make the header blue",
+    "make the button red",
+    "fix the typo in the footer",
+    "add a filter input above the users table",
+    "show revenue per month in the revenue chart",
+    "add a dark mode toggle",
+]
+
+
+def make_source(imports: list[str], size: int) -> str:
+    lines = [f'import {{ X{i} }} from "@/{spec}";' for i, spec in enumerate(imports)]
+    lines.append('import { cn } from "@/lib/utils";')
+    lines += ["", "export function Component() {", "  return ("]
+    while sum(map(len, lines)) < size:
+        lines.append('    <div className={cn("flex items-center gap-2")}>{label}</div>')
+    lines += ["  );", "}"]
+    return "\n".join(lines)
+
+
+def make_project() -> dict[str, str]:
+    code_map = {
+        f"{ROOT}/components/ui/{name}.tsx": make_source(["lib/utils"], size)
+        for name, size in UI_COMPONENTS.items()
+    }
+    for path, (imports, size) in FEATURES.items():
+        code_map[f"{ROOT}/{path}"] = make_source(imports, size)
+    return code_map
+
+
+def prompt_tokens(files: list[dict[str, str]]) -> int:
+    return sum(estimate_tokens(f["path"]) + estimate_tokens(f["content"]) for f in files)
+
+
+async def first_token_seconds(feedback: str, code_files: list[dict], route) -> float:
+    samples = []
+    for _ in range(LIVE_SAMPLES):
+        # A unique first file keeps the provider from serving the code from its
+        # prompt cache, which would hide the prefill cost we want to see
+        nonce = {"path": f"{ROOT}/.nonce", "content": uuid.uuid4().hex}
+        abort = AbortController()
+        start = time.perf_counter()
+        stream = b.stream.EditCode(
+            [],
+            feedback,
+            [nonce, *code_files],
+            PACKAGE_JSON,
+            baml_options={
+                "client_registry": client_registry(route),
+                "abort_controller": abort,
+            },
+        )
+        async for _ in stream:
+            samples.append(time.perf_counter() - start)
+            # Only the first token matters; don't pay for the rest
+            abort.abort()
+            break
+    return statistics.median(samples)
+
+
+async def main():
+    code_map = make_project()
+    all_files = [
+        {"path": path, "content": content} for path, content in sorted(code_map.items())
+    ]
+    full = prompt_tokens(all_files)
+    print(f"Project: {len(code_map)} files, ~{full} tokens sent in full\n")
+    header = f"{'feedback':<46} {'files':>7} {'tokens':>8} {'saved':>6} {'select ms':>10}"
+    if LIVE:
+        header += f" {'ttft full':>10} {'ttft sel':>9}"
+    print(header)
+
+    graph = ImportGraph()
+    for feedback in FEEDBACK:
+        start = time.perf_counter()
+        graph.sync(code_map)
+        targets = edit_targets(code_map, feedback)
+        context_map = select_context(graph, code_map, targets)
+        files = context_files(code_map, context_map)
+        elapsed = time.perf_counter() - start
+
+        tokens = prompt_tokens(files)
+        row = (
+            f"{feedback:<46} {len(context_map):>3}/{len(code_map):<3} {tokens:>8} "
+            f"{1 - tokens / full:>6.0%} {elapsed * 1000:>10.2f}"
+        )
+        if LIVE:
+            # Same model for both prompts, so only the context differs
+            route = route_edit(
+                feedback,
+                target_tokens=sum(estimate_tokens(code_map[path]) for path in targets),
+                target_count=len(targets),
+                has_history=True,
+            )
+            ttft_full = await first_token_seconds(feedback, all_files, route)
+            ttft_selected = await first_token_seconds(feedback, files, route)
+            row += f" {ttft_full:>10.2f} {ttft_selected:>9.2f}"
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
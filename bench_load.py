@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark for load_code's two paths: the single tar archive vs. the per-file
+walk (one list_files per directory, one download per file).
+The sandbox is a local stand-in that runs the same commands and file calls
+against a generated project on local disk, counts each one as a remote call,
+and adds a fixed round-trip latency to it.
+"""
+import io
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.loader import load_archive, load_files
+
+FILE_COUNTS = [20, 100, 500]
+FILES_PER_DIR = 10
+FILE_BYTES = 2 * 1024
+# Simulated round trip per remote call; pass a different value in seconds as argv[1]
+ROUND_TRIP_SECONDS = float(sys.argv[1]) if len(sys.argv) > 1 else 0.03
+
+
+class LocalProcess:
+    def __init__(self, args: tuple[str, ...]):
+        self.result = subprocess.run(args, capture_output=True, text=True)
+        self.stdout = io.StringIO(self.result.stdout)
+
+    def wait(self) -> int:
+        return self.result.returncode
+
+
+class LocalSandbox:
+    def __init__(self, round_trip: float):
+        self.round_trip = round_trip
+        self.calls: Counter[str] = Counter()
+        self.process = SimpleNamespace(exec=self.exec)
+        self.fs = SimpleNamespace(
+            list_files=self.list_files, download_file=self.download_file
+        )
+
+    def _remote(self, kind: str):
+        self.calls[kind] += 1
+        time.sleep(self.round_trip)
+
+    def exec(self, *args: str) -> LocalProcess:
+        self._remote("exec")
+        return LocalProcess(args)
+
+    def list_files(self, path: str) -> list:
+        self._remote("list_files")
+        return [
+            SimpleNamespace(name=entry.name, is_dir=entry.is_dir())
+            for entry in Path(path).iterdir()
+        ]
+
+    def download_file(self, sandbox_path: str, local_path: str):
+        self._remote("download_file")
+        shutil.copyfile(sandbox_path, local_path)
+
+
+def make_project(root: Path, files: int):
+    (root / "package.json").write_text('{"dependencies": {"react": "^18.2.0"}}')
+    for i in range(files):
+        path = root / "src" / "components" / f"group{i // FILES_PER_DIR}" / f"C{i}.tsx"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"export const C{i} = () => null;\n".ljust(FILE_BYTES, "/"))
+
+
+def bench(load, root: str) -> tuple[dict, float, int]:
+    sandbox = LocalSandbox(ROUND_TRIP_SECONDS)
+    start = time.perf_counter()
+    result = load(sandbox, root=root)
+    return sandbox.calls, time.perf_counter() - start, len(result["files"])
+
+
+def main():
+    print(f"Simulated round trip: {ROUND_TRIP_SECONDS * 1000:.0f} ms per remote call\n")
+    print(f"{'files':>6} {'method':>9} {'calls':>6} {'wall s':>8}  breakdown")
+
+    for files in FILE_COUNTS:
+        with tempfile.TemporaryDirectory() as tmp:
+            make_project(Path(tmp), files)
+            for method, load in [
+                ("archive", lambda sandbox, root: load_archive(sandbox, None, root)),
+                ("per-file", load_files),
+            ]:
+                calls, wall, loaded = bench(load, tmp)
+                assert loaded == files, (method, loaded)
+                breakdown = ", ".join(f"{k}={v}" for k, v in sorted(calls.items()))
+                print(
+                    f"{files:>6} {method:>9} {sum(calls.values()):>6} {wall:>8.2f}  "
+                    f"{breakdown}"
+                )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Load test for the MCP sandbox tools: blocking tool bodies called straight from
+the event loop (how plain sync tools run) vs. through ToolExecutor.
+A local stand-in replaces the sandbox: each tool body blocks for roughly the
+time the real Beam calls take, while slow sandbox creations and many
+load_code calls arrive at once.
+"""
+import asyncio
+import sys
+import time
+
+from src.executor import ToolExecutor
+
+CREATE_SECONDS = 1.0
+LOAD_SECONDS = 0.1
+CREATES = 4
+LOADS = 100
+
+
+def create_app_environment() -> dict:
+    time.sleep(CREATE_SECONDS)
+    return {"sandbox_id": "stand-in"}
+
+
+def load_code(sandbox_id: str) -> dict:
+    time.sleep(LOAD_SECONDS)
+    return {"files": {}}
+
+
+async def blocking(name: str, fn, *args):
+    return fn(*args)
+
+
+async def timed(latencies: list[float], submitted: float, call):
+    # Measured from when the whole batch was submitted, as a client sees it
+    await call
+    latencies.append(time.perf_counter() - submitted)
+
+
+async def scenario(run) -> dict:
+    load_latencies: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[
+            run("create_app_environment", create_app_environment)
+            for _ in range(CREATES)
+        ],
+        *[
+            timed(load_latencies, start, run("load_code", load_code, "stand-in"))
+            for _ in range(LOADS)
+        ],
+    )
+    wall = time.perf_counter() - start
+
+    load_latencies.sort()
+    return {
+        "wall": wall,
+        "throughput": (CREATES + LOADS) / wall,
+        "load_p50": load_latencies[len(load_latencies) // 2],
+        "load_p95": load_latencies[int(0.95 * len(load_latencies))],
+    }
+
+
+async def main():
+    print(
+        f"{CREATES} x create_app_environment ({CREATE_SECONDS}s) + "
+        f"{LOADS} x load_code ({LOAD_SECONDS}s), all at once\n"
+    )
+    print(f"{'mode':>10} {'wall s':>8} {'calls/s':>8} {'load p50':>9} {'load p95':>9}")
+
+    executor = ToolExecutor()
+    for mode, run in [("blocking", blocking), ("executor", executor.run)]:
+        result = await scenario(run)
+        print(
+            f"{mode:>10} {result['wall']:>8.2f} {result['throughput']:>8.1f} "
+            f"{result['load_p50']:>9.3f} {result['load_p95']:>9.3f}"
+        )
+
+    print(f"\nPer-tool stats: {executor.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
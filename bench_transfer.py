@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the MCP tools' file transfer staging: the old
+NamedTemporaryFile-on-disk path vs staging in tmpfs (src/transfer.py).
+The sandbox is a local stand-in that reads and writes the staged file by path,
+like the Beam SDK does, so only the local side of a transfer is measured.
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src import transfer
+
+SIZES = [2 * 1024, 20 * 1024, 200 * 1024, 2 * 1024 * 1024]
+ROUNDS = 200
+
+
+class LocalFs:
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+
+    def upload_file(self, local_path: str, sandbox_path: str):
+        self.files[sandbox_path] = Path(local_path).read_bytes()
+
+    def download_file(self, sandbox_path: str, local_path: str):
+        Path(local_path).write_bytes(self.files[sandbox_path])
+
+
+class LocalSandbox:
+    def __init__(self):
+        self.fs = LocalFs()
+
+
+def disk_download(sandbox, sandbox_path: str) -> bytes:
+    """load_code's previous read path"""
+    with tempfile.NamedTemporaryFile() as temp_file:
+        sandbox.fs.download_file(sandbox_path, temp_file.name)
+        temp_file.seek(0)
+        return temp_file.read()
+
+
+def disk_upload(sandbox, data: bytes, sandbox_path: str):
+    """edit_code's previous write path"""
+    with tempfile.NamedTemporaryFile() as temp_file:
+        temp_file.write(data)
+        temp_file.seek(0)
+        sandbox.fs.upload_file(temp_file.name, sandbox_path)
+
+
+def bench(upload, download, size: int) -> float:
+    sandbox = LocalSandbox()
+    data = b"x" * size
+
+    start = time.perf_counter()
+    for i in range(ROUNDS):
+        upload(sandbox, data, f"/app/src/file{i}.tsx")
+        download(sandbox, f"/app/src/file{i}.tsx")
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def main():
+    staging = transfer.staging_dir()
+    print(f"Staging transfers in: {staging or tempfile.gettempdir()}")
+    print(f"Default temp dir: {tempfile.gettempdir()}")
+    print(f"{ROUNDS} upload+download round trips per size, ms per round trip\n")
+    print(f"{'size':>10} {'disk':>10} {'memory':>10} {'speedup':>10}")
+
+    for size in SIZES:
+        disk = bench(disk_upload, disk_download, size)
+        memory = bench(transfer.upload_bytes, transfer.download_bytes, size)
+        print(f"{size:>10} {disk:>10.3f} {memory:>10.3f} {disk / memory:>9.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -82,6 +82,9 @@ const DeviceButton = styled(IconButton)<{ active: boolean }>(({ theme, active })
   },
 }));
 
+// How often to check whether the sandbox's dev server is up
+const READY_POLL_MS = 1000;
+
 const CreateScreen: React.FC = () => {
   const [selectedDevice, setSelectedDevice] = useState<"mobile" | "tablet" | "desktop">("desktop");
   const [iframeUrl, setIframeUrl] = useState<string | null>(null);
@@ -106,7 +109,13 @@ const CreateScreen: React.FC = () => {
       console.log('Received message:', message);
 
       // Handle different message types
-      if (message.type === MessageType.UPDATE_FILE && message.data?.url) {
+      if (message.type === MessageType.INIT && message.data?.url) {
+        // Show the sandbox right away; until the dev server is up we show the
+        // loading state and poll for it below
+        setIframeUrl(message.data.url);
+        setIframeReady(Boolean(message.data.ready));
+        setIframeError(false);
+      } else if (message.type === MessageType.UPDATE_FILE && message.data?.url) {
         setIframeUrl(message.data.url);
         setIframeReady(true);
         setIframeError(false);
@@ -281,6 +290,30 @@ IMPORTANT: Return ONLY the enhanced prompt text. No explanations, no quotes, no
     }
   }, [location.state, isConnected, sendMessage]);
 
+  useEffect(() => {
+    if (!iframeUrl || iframeReady || iframeError) {
+      return;
+    }
+    let cancelled = false;
+    const poll = async () => {
+      try {
+        // An opaque response is enough: the dev server answered
+        await fetch(iframeUrl, { mode: 'no-cors', cache: 'no-store' });
+        if (!cancelled) {
+          setIframeReady(true);
+        }
+      } catch {
+        // Not up yet
+      }
+    };
+    poll();
+    const interval = setInterval(poll, READY_POLL_MS);
+    return () => {
+      cancelled = true;
+      clearInterval(interval);
+    };
+  }, [iframeUrl, iframeReady, iframeError]);
+
   const LoadingState = () => (
     <Box sx={{ display: 'flex', flexDirection: 'column', alignItems: 'center', justifyContent: 'center', height: '100%', gap: 3 }}>
       <Box sx={{ position: 'relative', display: 'flex', alignItems: 'center', justifyContent: 'center' }}>
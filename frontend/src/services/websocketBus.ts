@@ -15,6 +15,8 @@ export class WebSocketBus {
   private reconnectAttempts = 0;
   private maxReconnectAttempts = 5;
   private reconnectDelay = 1000;
+  // Identifies this client's session on the agent, kept across reconnects
+  private sessionId = crypto.randomUUID();
 
   constructor(config: WebSocketBusConfig) {
     this.config = config;
@@ -58,7 +60,7 @@ export class WebSocketBus {
       this.reconnectAttempts = 0;
       this.config.messageBus.setConnected(true);
       
-      this.sendMessage(createMessage(MessageType.INIT, {}));
+      this.sendMessage(createMessage(MessageType.INIT, { wait_until_ready: true }));
     };
 
     this.ws.onclose = (event) => {
@@ -143,7 +145,8 @@ export class WebSocketBus {
         type: message.type,
         data: message.data,
         id: message.id,
-        timestamp: message.timestamp
+        timestamp: message.timestamp,
+        session_id: this.sessionId
       };
       
       const messageStr = JSON.stringify(wsMessage);
@@ -9,6 +9,10 @@ export enum MessageType {
   UPDATE_IN_PROGRESS = "update_in_progress",
   UPDATE_FILE = "update_file",
   UPDATE_COMPLETED = "update_completed",
+  CANCEL = "cancel",
+  QUEUED = "queued",
+  METRICS = "metrics",
+  STATS = "stats",
 }
 
 export enum Sender {
@@ -0,0 +1,72 @@
+import asyncio
+from collections import deque
+
+MAX_CONCURRENT_GENERATIONS = 10
+
+
+class Ticket:
+    """A place in an AdmissionQueue"""
+
+    def __init__(self, queue: "AdmissionQueue"):
+        self.queue = queue
+        self.admitted = False
+        self._changed = asyncio.Event()
+
+    @property
+    def position(self) -> int:
+        """1-based position among the waiting tickets, 0 once admitted"""
+        if self.admitted:
+            return 0
+        return self.queue.waiting.index(self) + 1
+
+    async def wait(self):
+        """Wait until this ticket is admitted or moves up the queue"""
+        await self._changed.wait()
+        self._changed.clear()
+
+    def notify(self):
+        self._changed.set()
+
+    def release(self):
+        self.queue.release(self)
+
+
+class AdmissionQueue:
+    """
+    FIFO admission with at most `limit` tickets admitted at once. Unlike a bare
+    semaphore it knows each waiter's position, so callers can report it.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.admitted = 0
+        self.waiting: deque[Ticket] = deque()
+
+    def enqueue(self) -> Ticket:
+        ticket = Ticket(self)
+        if self.admitted < self.limit and not self.waiting:
+            self.admitted += 1
+            ticket.admitted = True
+        else:
+            self.waiting.append(ticket)
+        return ticket
+
+    def release(self, ticket: Ticket):
+        if ticket.admitted:
+            ticket.admitted = False
+            self.admitted -= 1
+        elif ticket in self.waiting:
+            self.waiting.remove(ticket)
+        else:
+            return
+
+        admitted = []
+        while self.waiting and self.admitted < self.limit:
+            head = self.waiting.popleft()
+            head.admitted = True
+            self.admitted += 1
+            admitted.append(head)
+
+        # Newly admitted tickets can go, and everyone still waiting moved up
+        for waiter in [*admitted, *self.waiting]:
+            waiter.notify()
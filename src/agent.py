@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 import json
 import os
 import time
@@ -10,12 +12,61 @@ if TYPE_CHECKING:
     from mcp.types import CallToolResult, Tool
 
 
+from baml_py import AbortController, Collector
+from baml_py.errors import BamlAbortError
 from beam import Image, PythonVersion, realtime
 
-from baml_client.sync_client import BamlSyncClient, b
+from baml_client.async_client import BamlAsyncClient, b
 from baml_client.types import Message as ConvoMessage
 
+from .admission import MAX_CONCURRENT_GENERATIONS, AdmissionQueue, Ticket
+from .catalog import ToolCatalog, server_urls
 from .client import mcp_session
+from .client import pool as mcp_pool
+from .context import (
+    ImportGraph,
+    context_files,
+    edit_targets,
+    estimate_tokens,
+    select_context,
+)
+from .history import History
+from .metrics import (
+    TokenUsage,
+    TurnTimer,
+    generation_stats,
+    latency_stats,
+    replica_usage,
+    sandbox_usage,
+    usage_from_collector,
+)
+from .router import client_registry, route_edit
+from .session import (
+    DEFAULT_SESSION_ID,
+    MAX_SESSION_HISTORY_BYTES,
+    SessionRegistry,
+)
+from .snapshot import CodeSnapshot, stub_content
+from .writer import SandboxWriter
+
+# Streams of aborted generations, still running down in the background
+_draining: set[asyncio.Task] = set()
+
+
+async def _drain(iterator, pending: asyncio.Future | None):
+    """
+    Consume an aborted stream to its end, so its request thread has already
+    exited when the stream joins it
+    """
+    try:
+        if pending is not None:
+            await pending
+        async for _ in iterator:
+            pass
+    except (StopAsyncIteration, BamlAbortError):
+        pass
+    except Exception as e:
+        print(f"Error draining aborted stream: {e}")
 
 
 class MessageType(Enum):
@@ -28,6 +79,10 @@ class MessageType(Enum):
     UPDATE_IN_PROGRESS = "update_in_progress"
     UPDATE_FILE = "update_file"
     UPDATE_COMPLETED = "update_completed"
+    CANCEL = "cancel"
+    QUEUED = "queued"
+    METRICS = "metrics"
+    STATS = "stats"
 
 
 @dataclass
@@ -55,19 +110,102 @@ class Message:
         }
 
 
+class PartialMode(Enum):
+    FULL = "full"
+    DELTA = "delta"
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Number of leading characters `a` and `b` share"""
+    if b.startswith(a):
+        # The usual case: the plan only grew
+        return len(a)
+    for i, (x, y) in enumerate(zip(a, b, strict=False)):
+        if x != y:
+            return i
+    return min(len(a), len(b))
+
+
+class PlanEncoder:
+    """
+    Builds AGENT_PARTIAL / AGENT_FINAL payloads for the streamed plan.
+
+    In FULL mode every message carries the whole plan so far. In DELTA mode a
+    message carries an `offset` and the `delta` text to splice in there, i.e.
+    the client keeps `text[:offset] + delta`, and the final message also carries
+    a sha256 `checksum` of the full plan.
+    """
+
+    def __init__(self, mode: PartialMode):
+        self.mode = mode
+        self.sent_text = ""
+
+    def partial(self, text: str | None) -> dict | None:
+        if self.mode == PartialMode.FULL:
+            return {"text": text}
+
+        text = text or ""
+        offset = _common_prefix_length(self.sent_text, text)
+        if offset == len(self.sent_text) == len(text):
+            return None
+
+        self.sent_text = text
+        return {"offset": offset, "delta": text[offset:]}
+
+    def final(self, text: str) -> dict:
+        if self.mode == PartialMode.FULL:
+            return {"text": text}
+
+        data = self.partial(text) or {"offset": len(text), "delta": ""}
+        data["checksum"] = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return data
+
+
 class ToolType(Enum):
     CREATE_APP_ENVIRONMENT = "create_app_environment"
     LOAD_CODE = "load_code"
     EDIT_CODE = "edit_code"
+    PATCH_CODE = "patch_code"
+    CODE_VERSION = "code_version"
 
 
 class Agent:
-    def __init__(self, *, mcp_url: str):
-        self.model_client: BamlSyncClient = b
+    def __init__(
+        self,
+        *,
+        mcp_url: str,
+        session_id: str = DEFAULT_SESSION_ID,
+        max_history_bytes: int = MAX_SESSION_HISTORY_BYTES,
+        tool_catalog: ToolCatalog | None = None,
+        generation_queue: AdmissionQueue | None = None,
+    ):
+        self.model_client: BamlAsyncClient = b
         self.mcp_url: str = mcp_url
+        self.session_id: str = session_id
+        self.partial_mode: PartialMode = PartialMode.FULL
+        self.wait_until_ready: bool = False
+        self.tool_catalog: ToolCatalog = tool_catalog or ToolCatalog(mcp_url)
         self.tools: list[Tool] = []
         self.init_data: dict = {}
-        self.history: list[dict] = []
+        self.history: History = History(max_bytes=max_history_bytes)
+        self.snapshot: CodeSnapshot | None = None
+        self.import_graph: ImportGraph = ImportGraph()
+        self.last_edited: list[str] = []
+        self.usage: TokenUsage = TokenUsage()
+        self.cancel_events: set[asyncio.Event] = set()
+        # Turns of one session run one at a time, in the order they arrived
+        self.turn_queue: AdmissionQueue = AdmissionQueue(1)
+        self.generation_queue: AdmissionQueue = generation_queue or AdmissionQueue(
+            MAX_CONCURRENT_GENERATIONS
+        )
+
+    def negotiate(self, options: dict):
+        """Pick the protocol options requested by the client in INIT"""
+        try:
+            self.partial_mode = PartialMode(options.get("partial_mode"))
+        except ValueError:
+            self.partial_mode = PartialMode.FULL
+        self.wait_until_ready = bool(options.get("wait_until_ready"))
 
     async def init(self):
         await self.load_tools()
@@ -75,34 +213,7 @@ class Agent:
 
     async def load_tools(self):
         """Load tools from all MCP servers"""
-        self.tools = []
-
-        # Load tools from main MCP server
-        if self.mcp_url:
-            try:
-                async with mcp_session(self.mcp_url) as session:
-                    main_tools = await session.list_tools()
-                    self.tools.extend(main_tools)
-            except Exception as e:
-                print(f"Failed to load main MCP tools: {e}")
-
-        # Load tools from additional MCP servers
-        additional_servers = {
-            "THINKING_MCP_URL": "thinking",
-            "CONTEXT7_MCP_URL": "context7",
-            "EXA_MCP_URL": "exa"
-        }
-
-        for env_var, server_name in additional_servers.items():
-            server_url = os.getenv(env_var)
-            if server_url:
-                try:
-                    async with mcp_session(server_url) as session:
-                        server_tools = await session.list_tools()
-                        self.tools.extend(server_tools)
-                        print(f"Loaded {len(server_tools)} tools from {server_name} server")
-                except Exception as e:
-                    print(f"Failed to load {server_name} MCP tools: {e}")
+        self.tools = await self.tool_catalog.get()
 
     async def create_app_environment(self):
         """Create app environment using main MCP server"""
@@ -115,28 +226,123 @@ class Agent:
             async with mcp_session(self.mcp_url) as session:
                 response: CallToolResult = await session.call_tool(
                     name=ToolType.CREATE_APP_ENVIRONMENT.value,
-                    arguments={},
+                    arguments={"wait_until_ready": self.wait_until_ready},
                 )
                 self.init_data = json.loads(response.content[0].text)
         except Exception as e:
             print(f"Failed to create app environment: {e}")
             self.init_data = {"sandbox_id": "default"}
 
-    async def load_code(self, sandbox_id: str):
+    async def load_code(
+        self, sandbox_id: str, manifest: dict | None = None
+    ) -> dict:
         if not self.mcp_url:
             print("No main MCP URL configured for loading code")
-            return {}, {}
+            return {}
 
         try:
             async with mcp_session(self.mcp_url) as session:
                 response: CallToolResult = await session.call_tool(
                     name=ToolType.LOAD_CODE.value,
-                    arguments={"sandbox_id": sandbox_id},
+                    arguments={"sandbox_id": sandbox_id, "manifest": manifest},
                 )
                 return json.loads(response.content[0].text)
         except Exception as e:
             print(f"Failed to load code: {e}")
-            return {}, {}
+            return {}
+
+    async def code_version(self, sandbox_id: str) -> str | None:
+        if not self.mcp_url:
+            return None
+
+        try:
+            async with mcp_session(self.mcp_url) as session:
+                response: CallToolResult = await session.call_tool(
+                    name=ToolType.CODE_VERSION.value,
+                    arguments={"sandbox_id": sandbox_id},
+                )
+                return response.content[0].text
+        except Exception as e:
+            print(f"Failed to get code version: {e}")
+            return None
+
+    async def get_code(self, sandbox_id: str):
+        """Return the sandbox's code, reusing our snapshot if it's still current"""
+        version = await self.code_version(sandbox_id)
+        if self.snapshot is not None and self.snapshot.matches(sandbox_id, version):
+            return self.snapshot.files, self.snapshot.package_json
+
+        # Only ask for what changed since our snapshot, if we have one
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.sandbox_id == sandbox_id:
+            result = await self.load_code(sandbox_id, snapshot.manifest or None)
+        else:
+            snapshot, result = None, await self.load_code(sandbox_id)
+
+        if "files" not in result:
+            # The load failed. Keep what we had, but unversioned so the next
+            # turn tries again instead of trusting it.
+            if snapshot is None:
+                self.snapshot = None
+                return {}, ""
+            snapshot.version = None
+            return snapshot.files, snapshot.package_json
+
+        if snapshot is not None and result.get("incremental"):
+            snapshot.apply_load(version, result)
+        else:
+            self.snapshot = CodeSnapshot.new(sandbox_id, version, result)
+        return self.snapshot.files, self.snapshot.package_json
+
+    async def write_code(self, sandbox_id: str, code_map: dict):
+        """Edit code in the sandbox, writing the changes through to our snapshot"""
+        result = await self.edit_code(sandbox_id, code_map)
+        self._write_through(sandbox_id, code_map, result)
+        return result
+
+    async def apply_patches(self, sandbox_id: str, edits: dict):
+        """Patch code in the sandbox, writing the patched files through to our snapshot"""
+        result = await self.patch_code(sandbox_id, edits)
+        self._write_through(sandbox_id, result.get("files", {}), result)
+        return result
+
+    async def write_changes(self, sandbox_id: str, changes: dict) -> list[str]:
+        """
+        Write a batch of changes, where each change is either the file's new
+        content or a list of hunks. Returns the paths whose hunks didn't apply.
+        """
+        code_map = {}
+        edits = {}
+        for path, change in changes.items():
+            if isinstance(change, str):
+                code_map[path] = change
+            else:
+                edits[path] = change
+
+        failed = []
+        if code_map:
+            await self.write_code(sandbox_id, code_map)
+        if edits:
+            result = await self.apply_patches(sandbox_id, edits)
+            for path in edits:
+                if path not in result.get("files", {}):
+                    print(f"Failed to patch {path}: {result.get('failed', {}).get(path)}")
+                    failed.append(path)
+        return failed
+
+    def _write_through(self, sandbox_id: str, code_map: dict, result: dict):
+        snapshot = self.snapshot
+        if snapshot is None or snapshot.sandbox_id != sandbox_id:
+            return
+
+        if "version" in result:
+            snapshot.update(code_map)
+            # Only a snapshot that was current stays current after our own write
+            if snapshot.version is not None:
+                snapshot.version = result["version"]
+        else:
+            # The write failed or we can't tell what the sandbox holds now
+            self.snapshot = None
 
     async def edit_code(self, sandbox_id: str, code_map: dict):
         if not self.mcp_url:
@@ -157,16 +363,28 @@ class Agent:
             print(f"Failed to edit code: {e}")
             return {}
 
+    async def patch_code(self, sandbox_id: str, edits: dict):
+        if not self.mcp_url:
+            print("No main MCP URL configured for code editing")
+            return {}
+
+        try:
+            async with mcp_session(self.mcp_url) as session:
+                response: CallToolResult = await session.call_tool(
+                    name=ToolType.PATCH_CODE.value,
+                    arguments={
+                        "sandbox_id": sandbox_id,
+                        "edits": edits,
+                    },
+                )
+                return json.loads(response.content[0].text)
+        except Exception as e:
+            print(f"Failed to patch code: {e}")
+            return {}
+
     async def call_mcp_tool(self, tool_name: str, arguments: dict, server_type: str = "main"):
         """Call a tool from any MCP server"""
-        server_urls = {
-            "main": self.mcp_url,
-            "thinking": os.getenv("THINKING_MCP_URL"),
-            "context7": os.getenv("CONTEXT7_MCP_URL"),
-            "exa": os.getenv("EXA_MCP_URL")
-        }
-
-        server_url = server_urls.get(server_type)
+        server_url = server_urls(self.mcp_url).get(server_type)
         if not server_url:
             raise ValueError(f"No URL configured for {server_type} MCP server")
 
@@ -182,83 +400,400 @@ class Agent:
             raise
 
     async def add_to_history(self, user_feedback: str, agent_plan: str):
-        self.history.append(
-            {
-                "role": "user",
-                "content": user_feedback,
-            }
-        )
-
-        self.history.append(
-            {
-                "role": "assistant",
-                "content": agent_plan,
-            }
-        )
+        self.history.add(user_feedback, agent_plan)
 
     def get_history(self):
         return [
             ConvoMessage(role=msg["role"], content=msg["content"])
-            for msg in self.history
+            for msg in self.history.messages()
         ]
 
+    def select_context(
+        self, code_map: dict, feedback: str
+    ) -> tuple[dict, list[str]]:
+        """
+        Narrow the code sent to the model to what the edit is likely to need.
+        Returns the selected files and the edit targets they were picked from.
+        """
+        self.import_graph.sync(code_map)
+        targets = edit_targets(code_map, feedback, self.last_edited)
+        if not targets:
+            return code_map, targets
+
+        context_map = select_context(self.import_graph, code_map, targets)
+        print(
+            f"Selected {len(context_map)}/{len(code_map)} files for context "
+            f"(~{sum(map(estimate_tokens, context_map.values()))}/"
+            f"{sum(map(estimate_tokens, code_map.values()))} tokens)"
+        )
+        return context_map, targets
+
+    async def rewrite_files(
+        self, feedback: str, paths: list[str], code_map: dict, package_json: str
+    ) -> dict:
+        """
+        Ask for the full content of files whose hunks failed to apply. Only
+        files whose current content we know (from this turn's `code_map`) are
+        rewritten; the model can't rewrite what it can't see.
+        """
+        unknown = [path for path in paths if path not in code_map]
+        if unknown:
+            print(f"Not rewriting files with unknown content: {', '.join(unknown)}")
+        paths = [path for path in paths if path in code_map]
+        if not paths:
+            return {}
+
+        code_files = [{"path": path, "content": code_map[path]} for path in paths]
+        collector = Collector(name="EditCode")
+        started = time.monotonic()
+        result = await self.model_client.EditCode(
+            self.get_history(),
+            f"{feedback}\n\nYour edits to {', '.join(paths)} could not be applied. "
+            "Return the complete updated content of these files in `files`.",
+            code_files,
+            package_json,
+            baml_options={"collector": collector},
+        )
+        # Not streamed: the first token arrives with the whole response
+        elapsed = time.monotonic() - started
+        self.record_usage(
+            collector, self.init_data["sandbox_id"], elapsed, ttft=elapsed
+        )
+        return {file.path: file.content for file in result.files if file.path in paths}
+
+    def record_usage(
+        self,
+        collector: Collector,
+        sandbox_id: str,
+        generation_seconds: float,
+        *,
+        ttft: float,
+    ) -> TokenUsage:
+        """Attribute an EditCode call's usage to the session, sandbox and replica"""
+        usage = usage_from_collector(collector, generation_seconds, ttft)
+        self.usage.add(usage)
+        sandbox_usage.add(sandbox_id, usage)
+        replica_usage.add(usage)
+        print(
+            f"EditCode usage for session {self.session_id} "
+            f"(sandbox {sandbox_id}): {usage.to_dict()}"
+        )
+        return usage
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by this session's history, snapshot and graph"""
+        snapshot = self.snapshot.size() if self.snapshot is not None else 0
+        return self.history.size() + snapshot + self.import_graph.size()
+
+    def cancel(self) -> bool:
+        """Abort the in-flight generation and any turns queued behind it"""
+        pending = [event for event in self.cancel_events if not event.is_set()]
+        for event in pending:
+            event.set()
+        return bool(pending)
+
+    async def _until_cancelled(
+        self, stream, cancel_event: asyncio.Event, abort: AbortController
+    ):
+        """
+        Iterate `stream`, stopping as soon as the generation is cancelled or our
+        consumer goes away. Either way the LLM request is aborted and the rest of
+        the stream is drained in the background: closing a BamlStream before its
+        request thread exits joins that thread on the event loop.
+        """
+        iterator = aiter(stream)
+        cancelled = asyncio.ensure_future(cancel_event.wait())
+        item = None
+        finished = False
+        try:
+            while True:
+                item = asyncio.ensure_future(anext(iterator))
+                await asyncio.wait(
+                    {item, cancelled}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not item.done():
+                    return
+
+                error = item.exception()
+                if error is not None:
+                    finished = True
+                    if isinstance(error, StopAsyncIteration | BamlAbortError):
+                        return
+                    raise error
+                partial, item = item.result(), None
+                yield partial
+        finally:
+            cancelled.cancel()
+            if not finished:
+                abort.abort()
+                task = asyncio.create_task(_drain(iterator, item))
+                _draining.add(task)
+                task.add_done_callback(_draining.discard)
+
+    async def _wait_for_admission(
+        self, ticket: Ticket, queue: str, cancel_event: asyncio.Event
+    ):
+        """Yield QUEUED messages with our position until the ticket is admitted"""
+        msg_id = str(uuid.uuid4())
+        while not ticket.admitted and not cancel_event.is_set():
+            yield Message.new(
+                MessageType.QUEUED,
+                {"queue": queue, "position": ticket.position},
+                id=msg_id,
+            ).to_dict()
+
+            changed = asyncio.ensure_future(ticket.wait())
+            cancelled = asyncio.ensure_future(cancel_event.wait())
+            await asyncio.wait({changed, cancelled}, return_when=asyncio.FIRST_COMPLETED)
+            changed.cancel()
+            cancelled.cancel()
+
     async def send_feedback(self, feedback: str):
+        timer = TurnTimer()
+        cancel_event = asyncio.Event()
+        self.cancel_events.add(cancel_event)
+        turn = self.turn_queue.enqueue()
+        generation = None
+        outcome = "disconnected"
+        try:
+            async for message in self._wait_for_admission(turn, "session", cancel_event):
+                yield message
+
+            if not cancel_event.is_set():
+                generation = self.generation_queue.enqueue()
+                generation_stats.queued += 1
+                try:
+                    async for message in self._wait_for_admission(
+                        generation, "generation", cancel_event
+                    ):
+                        yield message
+                finally:
+                    generation_stats.queued -= 1
+
+            if cancel_event.is_set():
+                outcome = "cancelled"
+                yield Message.new(MessageType.CANCEL, {"cancelled": True}).to_dict()
+                return
+
+            timer.record("queue_wait", timer.elapsed())
+            generation_stats.active += 1
+            try:
+                async for message in self._generate(feedback, cancel_event, timer):
+                    yield message
+            finally:
+                generation_stats.active -= 1
+
+            outcome = "cancelled" if cancel_event.is_set() else "completed"
+        except Exception:
+            outcome = "failed"
+            raise
+        finally:
+            # Runs on completion, CANCEL, errors and when the client goes away
+            # and the generator is closed, freeing our slots in every case
+            if generation is not None:
+                generation.release()
+            turn.release()
+            self.cancel_events.discard(cancel_event)
+            setattr(generation_stats, outcome, getattr(generation_stats, outcome) + 1)
+            print(
+                f"Generation {outcome} for session {self.session_id} "
+                f"({generation_stats.active} active, {generation_stats.queued} queued)"
+            )
+
+    async def _generate(
+        self, feedback: str, cancel_event: asyncio.Event, timer: TurnTimer
+    ):
         yield Message.new(MessageType.UPDATE_IN_PROGRESS, {}).to_dict()
 
-        code_map, package_json = await self.load_code(self.init_data["sandbox_id"])
+        sandbox_id = self.init_data["sandbox_id"]
+        with timer.span("load_code"):
+            code_map, package_json = await self.get_code(sandbox_id)
+        with timer.span("select_context"):
+            context_map, targets = self.select_context(code_map, feedback)
+
+        route = route_edit(
+            feedback,
+            target_tokens=sum(estimate_tokens(code_map[path]) for path in targets),
+            target_count=len(targets),
+            has_history=len(self.history) > 0,
+        )
+        print(f"Routing to {route.model} ({route.name}): {route.reason}")
 
-        code_files = []
-        for path, content in code_map.items():
-            code_files.append({"path": path, "content": content})
+        # Keep the file dump in a stable order so it can be prompt-cached
+        code_files = context_files(code_map, context_map)
+        # Filtered files (assets, binaries, huge files) are listed, not shown
+        stubs = self.snapshot.stubs if self.snapshot is not None else {}
+        for path, stub in sorted(stubs.items()):
+            code_files.append({"path": path, "content": stub_content(stub)})
 
         history = self.get_history()
+        collector = Collector(name="EditCode")
+        abort = AbortController()
+        stream_started = last_output = time.monotonic()
         stream = self.model_client.stream.EditCode(
-            history, feedback, code_files, package_json
+            history,
+            feedback,
+            code_files,
+            package_json,
+            baml_options={
+                "collector": collector,
+                "client_registry": client_registry(route),
+                "abort_controller": abort,
+            },
         )
         sent_plan = False
+        plan_encoder = PlanEncoder(self.partial_mode)
 
-        new_code_map = {}
-        plan_msg_id = str(uuid.uuid4())
-        file_msg_id = str(uuid.uuid4())
-
-        for partial in stream:
-            if partial.plan.state != "Complete" and not sent_plan:
-                yield Message.new(
-                    MessageType.AGENT_PARTIAL,
-                    {"text": partial.plan.value},
-                    id=plan_msg_id,
-                ).to_dict()
+        # Files and edits arrive complete (both are @@stream.done), so upload
+        # each one while the rest are still being generated
+        failed_edits = []
 
-            if partial.plan.state == "Complete" and not sent_plan:
-                yield Message.new(
-                    MessageType.AGENT_FINAL,
-                    {"text": partial.plan.value},
-                    id=plan_msg_id,
-                ).to_dict()
+        async def write_changes(changes: dict):
+            failed_edits.extend(await self.write_changes(sandbox_id, changes))
 
-                await self.add_to_history(feedback, partial.plan.value)
+        writer = SandboxWriter(write_changes)
+        writer.start()
 
-                sent_plan = True
+        new_code_map = {}
+        plan_msg_id = str(uuid.uuid4())
+        file_msg_id = str(uuid.uuid4())
 
-            for file in partial.files:
-                if file.path not in new_code_map:
+        try:
+            async for partial in self._until_cancelled(stream, cancel_event, abort):
+                if "time_to_first_token" not in timer.stages:
+                    timer.record("time_to_first_token", time.monotonic() - stream_started)
+
+                if partial.plan.state != "Complete" and not sent_plan:
+                    data = plan_encoder.partial(partial.plan.value)
+                    if data is not None:
+                        yield Message.new(
+                            MessageType.AGENT_PARTIAL,
+                            data,
+                            id=plan_msg_id,
+                        ).to_dict()
+
+                if partial.plan.state == "Complete" and not sent_plan:
                     yield Message.new(
-                        MessageType.UPDATE_FILE,
-                        {"text": f"Working on {file.path}"},
-                        id=file_msg_id,
+                        MessageType.AGENT_FINAL,
+                        plan_encoder.final(partial.plan.value),
+                        id=plan_msg_id,
                     ).to_dict()
 
-                    new_code_map[file.path] = file.content
-
-        await self.edit_code(self.init_data["sandbox_id"], new_code_map)
+                    await self.add_to_history(feedback, partial.plan.value)
+
+                    sent_plan = True
+                    last_output = time.monotonic()
+                    timer.record("plan", last_output - stream_started)
+
+                for file in partial.files:
+                    if file.path not in new_code_map:
+                        yield Message.new(
+                            MessageType.UPDATE_FILE,
+                            {"text": f"Working on {file.path}"},
+                            id=file_msg_id,
+                        ).to_dict()
+
+                        new_code_map[file.path] = file.content
+                        timer.record_file(file.path, time.monotonic() - last_output)
+                        last_output = time.monotonic()
+                        await writer.put(file.path, file.content)
+
+                for edit in partial.edits:
+                    if edit.path not in new_code_map:
+                        yield Message.new(
+                            MessageType.UPDATE_FILE,
+                            {"text": f"Working on {edit.path}"},
+                            id=file_msg_id,
+                        ).to_dict()
+
+                        hunks = [hunk.model_dump() for hunk in edit.hunks]
+                        new_code_map[edit.path] = hunks
+                        timer.record_file(edit.path, time.monotonic() - last_output)
+                        last_output = time.monotonic()
+                        await writer.put(edit.path, hunks)
+
+            timer.record("generation", time.monotonic() - stream_started)
+            latency_stats.observe(
+                f"generation:{route.name}", timer.stages["generation"]
+            )
+            # Throughput is measured over the time spent streaming output tokens
+            ttft = timer.stages.get("time_to_first_token", 0.0)
+            usage = self.record_usage(
+                collector,
+                sandbox_id,
+                timer.stages["generation"] - ttft,
+                ttft=ttft,
+            )
+            if cancel_event.is_set():
+                # Drop the stream and any writes that haven't gone out yet
+                yield Message.new(MessageType.CANCEL, {"cancelled": True}).to_dict()
+                return
+
+            flush_seconds = await writer.close()
+            self.last_edited = list(new_code_map)
+        finally:
+            writer.cancel()
+
+        timer.record("edit_code", writer.write_seconds)
+        timer.record("edit_code_after_generation", flush_seconds)
+
+        if failed_edits:
+            # Fall back to whole-file rewrites for the files we couldn't patch
+            yield Message.new(
+                MessageType.UPDATE_FILE,
+                {"text": f"Rewriting {', '.join(failed_edits)}"},
+                id=file_msg_id,
+            ).to_dict()
+
+            with timer.span("rewrite"):
+                rewrites = await self.rewrite_files(
+                    feedback, failed_edits, code_map, package_json
+                )
+                if rewrites:
+                    await self.write_code(sandbox_id, rewrites)
+
+        # Not measured: assumes writing everything after the stream would have
+        # taken as long as the writes that overlapped with generation did
+        estimated_seconds_saved = writer.write_seconds - flush_seconds
+        print(
+            f"Wrote {writer.files_written} files in {writer.write_seconds:.2f}s, "
+            f"{flush_seconds:.2f}s of it after generation finished "
+            f"(est. ~{estimated_seconds_saved:.2f}s saved vs. writing at end of stream)"
+        )
 
+        yield Message.new(
+            MessageType.METRICS,
+            {
+                **timer.finish(),
+                "usage": usage.to_dict(),
+                "route": route.to_dict(),
+                "estimates": {
+                    "write_seconds_saved": round(estimated_seconds_saved, 3),
+                },
+            },
+        ).to_dict()
         yield Message.new(MessageType.UPDATE_COMPLETED, {}).to_dict()
 
 
 async def _load_agent():
-    agent = Agent(mcp_url=os.getenv("MOJOCODE_MCP_URL"))
+    mcp_url = os.getenv("MOJOCODE_MCP_URL")
+    tool_catalog = ToolCatalog(mcp_url)
+    generation_queue = AdmissionQueue(MAX_CONCURRENT_GENERATIONS)
+    sessions = SessionRegistry(
+        lambda session_id: Agent(
+            mcp_url=mcp_url,
+            session_id=session_id,
+            tool_catalog=tool_catalog,
+            generation_queue=generation_queue,
+        )
+    )
     print("Loaded MojoCode agent")
-    return agent
+    return sessions
+
+
+def _session_id(msg: dict) -> str:
+    data = msg.get("data") or {}
+    return msg.get("session_id") or data.get("session_id") or DEFAULT_SESSION_ID
 
 
 @realtime(
@@ -270,19 +805,44 @@ async def _load_agent():
         python_packages="requirements.txt", python_version=PythonVersion.Python312
     ),
     secrets=["OPENAI_API_KEY", "MOJOCODE_MCP_URL", "THINKING_MCP_URL", "CONTEXT7_MCP_URL", "EXA_MCP_URL"],
-    concurrent_requests=10,
+    # Generations are capped by MAX_CONCURRENT_GENERATIONS, so extra
+    # connections wait in the queue instead of being turned away
+    concurrent_requests=50,
     keep_warm_seconds=60,
 )
 async def handler(event, context):
-    agent: Agent = context.on_start_value
+    sessions: SessionRegistry = context.on_start_value
     msg = json.loads(event)
+    agent = sessions.get(_session_id(msg))
 
     msg_type = msg.get("type")
     if msg_type == MessageType.USER.value:
         return agent.send_feedback(msg["data"]["text"])
     elif msg_type == MessageType.INIT.value:
+        agent.negotiate(msg.get("data") or {})
         await agent.init()
-        return Message.new(MessageType.INIT, agent.init_data).to_dict()
+        return Message.new(
+            MessageType.INIT,
+            {**agent.init_data, "partial_mode": agent.partial_mode.value},
+        ).to_dict()
+    elif msg_type == MessageType.CANCEL.value:
+        return Message.new(MessageType.CANCEL, {"cancelled": agent.cancel()}).to_dict()
+    elif msg_type == MessageType.STATS.value:
+        return Message.new(
+            MessageType.STATS,
+            {
+                "sessions": len(sessions),
+                "generations": generation_stats.to_dict(),
+                "latency": latency_stats.summary(),
+                "usage": replica_usage.to_dict(),
+                "session_usage": agent.usage.to_dict(),
+                "sandbox_usage": sandbox_usage.get(
+                    agent.init_data.get("sandbox_id", "default")
+                ).to_dict(),
+                "sandboxes": len(sandbox_usage),
+                "mcp_pool": mcp_pool.stats(),
+            },
+        ).to_dict()
     elif msg_type == MessageType.LOAD_CODE.value:
         code_map = await agent.load_code(msg["data"]["sandbox_id"])
         return Message.new(MessageType.LOAD_CODE, code_map).to_dict()
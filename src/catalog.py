@@ -0,0 +1,132 @@
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING
+
+from .client import mcp_session
+
+if TYPE_CHECKING:
+    from mcp.types import Tool
+
+
+TOOL_CATALOG_TTL = 300.0
+DISCOVERY_TIMEOUT = 10.0
+# First retry delay for a server whose discovery failed; doubles per failure,
+# up to the catalog TTL
+RETRY_BACKOFF = 5.0
+
+# Additional MCP servers, by server type, and the env var holding their URL
+ADDITIONAL_SERVERS = {
+    "thinking": "THINKING_MCP_URL",
+    "context7": "CONTEXT7_MCP_URL",
+    "exa": "EXA_MCP_URL",
+}
+
+
+def server_urls(mcp_url: str | None) -> dict[str, str | None]:
+    urls = {"main": mcp_url}
+    for server_type, env_var in ADDITIONAL_SERVERS.items():
+        urls[server_type] = os.getenv(env_var)
+    return urls
+
+
+class ToolCatalog:
+    """
+    Process-wide cache of the tools exposed by every MCP server, shared by all
+    sessions. Servers are queried concurrently; once the catalog is warm, stale
+    entries are served while a refresh runs in the background. The catalog only
+    counts as loaded once a server has answered, and servers that failed are
+    retried on their own with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        mcp_url: str | None,
+        *,
+        ttl: float = TOOL_CATALOG_TTL,
+        retry_backoff: float = RETRY_BACKOFF,
+    ):
+        self.mcp_url = mcp_url
+        self.ttl = ttl
+        self.retry_backoff = retry_backoff
+        self.loaded_at: float | None = None
+        self._tools_by_server: dict[str, list[Tool]] = {}
+        self._failures: dict[str, int] = {}
+        self._retry_at: dict[str, float] = {}
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def tools(self) -> list["Tool"]:
+        return [tool for tools in self._tools_by_server.values() for tool in tools]
+
+    async def get(self) -> list["Tool"]:
+        now = time.monotonic()
+        retries = [
+            server_type
+            for server_type, retry_at in self._retry_at.items()
+            if retry_at <= now
+        ]
+        if self.loaded_at is None and not self._retry_at:
+            await self.refresh()
+        elif self.loaded_at is not None and now - self.loaded_at > self.ttl:
+            self.refresh_in_background()
+        elif retries and self.loaded_at is None:
+            # Nothing to serve yet, so wait for the retry
+            await self.refresh(retries)
+        elif retries:
+            self.refresh_in_background(retries)
+
+        return self.tools
+
+    def refresh_in_background(
+        self, server_types: list[str] | None = None
+    ) -> asyncio.Task:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh(server_types))
+        return self._refresh_task
+
+    async def refresh(self, server_types: list[str] | None = None):
+        # Concurrent callers share the same in-flight refresh
+        await asyncio.shield(self.refresh_in_background(server_types))
+
+    async def _refresh(self, server_types: list[str] | None = None):
+        """Query `server_types`, or every configured server if None"""
+        urls = {
+            server_type: url
+            for server_type, url in server_urls(self.mcp_url).items()
+            if url and (server_types is None or server_type in server_types)
+        }
+        results = await asyncio.gather(
+            *(self._list_tools(server_type, url) for server_type, url in urls.items())
+        )
+
+        now = time.monotonic()
+        for server_type, tools in zip(urls, results, strict=True):
+            if tools is None:
+                # Keep serving the previous tools of a server that failed to
+                # refresh, and try it again after a backoff
+                failures = self._failures.get(server_type, 0) + 1
+                self._failures[server_type] = failures
+                self._retry_at[server_type] = now + min(
+                    self.retry_backoff * 2 ** (failures - 1), self.ttl
+                )
+            else:
+                self._tools_by_server[server_type] = tools
+                self._failures.pop(server_type, None)
+                self._retry_at.pop(server_type, None)
+
+        # Retrying a few servers doesn't make the rest of a warm catalog fresh
+        answered = any(tools is not None for tools in results)
+        if answered and (server_types is None or self.loaded_at is None):
+            self.loaded_at = now
+
+    async def _list_tools(self, server_type: str, url: str) -> list["Tool"] | None:
+        try:
+            async with asyncio.timeout(DISCOVERY_TIMEOUT), mcp_session(url) as session:
+                result = await session.list_tools()
+        except Exception as e:
+            print(f"Failed to load {server_type} MCP tools: {e}")
+            return None
+
+        print(f"Loaded {len(result.tools)} tools from {server_type} server")
+        return result.tools
@@ -1,14 +1,212 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
 
+import anyio
 from mcp.client.session import ClientSession
 from mcp.client.sse import sse_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
 
 logger = logging.getLogger(__name__)
 
+MAX_POOLED_SESSIONS = 16
+HEALTH_CHECK_INTERVAL = 30.0
+PING_TIMEOUT = 5.0
+# ClientSession has no read timeout by default, so a request on a connection
+# whose stream died would wait forever. Long enough for create_app_environment.
+READ_TIMEOUT = 180.0
+
+# Errors that mean the underlying connection is gone, not that the call failed
+CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+
+class PooledSession:
+    """
+    An initialized ClientSession kept open in a background task, since the SSE
+    transport has to be entered and exited from the same task.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.session: ClientSession | None = None
+        self.last_checked = 0.0
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._disconnected = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def open(self):
+        self._task = asyncio.create_task(self._run())
+        ready = asyncio.create_task(self._ready.wait())
+        try:
+            await asyncio.wait(
+                {self._task, ready}, return_when=asyncio.FIRST_COMPLETED
+            )
+        except asyncio.CancelledError:
+            self._task.cancel()
+            raise
+        finally:
+            ready.cancel()
+
+        if not self._ready.is_set():
+            # Surface the connection error from the background task
+            await self._task
+
+        self.last_checked = time.monotonic()
+
+    async def _run(self):
+        try:
+            async with sse_client(self.url) as (read, write):
+                # Relay the read stream so we notice when the server side closes it
+                relay_send, relay_read = anyio.create_memory_object_stream(0)
+                relay = asyncio.create_task(self._relay(read, relay_send))
+                try:
+                    async with ClientSession(
+                        relay_read,
+                        write,
+                        read_timeout_seconds=timedelta(seconds=READ_TIMEOUT),
+                    ) as session:
+                        await session.initialize()
+                        self.session = session
+                        self._ready.set()
+                        await self._wait_closed()
+                finally:
+                    relay.cancel()
+        finally:
+            self.session = None
+
+    async def _relay(self, read, relay_send):
+        try:
+            async with relay_send:
+                async for message in read:
+                    await relay_send.send(message)
+        finally:
+            self._disconnected.set()
+
+    async def _wait_closed(self):
+        closing = asyncio.create_task(self._closing.wait())
+        disconnected = asyncio.create_task(self._disconnected.wait())
+        try:
+            await asyncio.wait(
+                {closing, disconnected}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            closing.cancel()
+            disconnected.cancel()
+
+        if self._disconnected.is_set() and not self._closing.is_set():
+            logger.warning(f"MCP session to {self.url} was closed by the server")
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self.session is not None
+            and not self._disconnected.is_set()
+            and not self._task.done()
+        )
+
+    async def healthy(self) -> bool:
+        if not self.alive:
+            return False
+
+        if time.monotonic() - self.last_checked < HEALTH_CHECK_INTERVAL:
+            return True
+
+        try:
+            async with asyncio.timeout(PING_TIMEOUT):
+                await self.session.send_ping()
+        except Exception as e:
+            logger.warning(f"MCP session to {self.url} failed health check: {e}")
+            return False
+
+        self.last_checked = time.monotonic()
+        return True
+
+    async def close(self):
+        self._closing.set()
+        if self._task is not None:
+            with suppress(Exception, asyncio.CancelledError):
+                await self._task
+
+
+class McpSessionPool:
+    """Keeps one initialized MCP session per server URL, reconnecting on failure"""
+
+    def __init__(self, *, max_size: int = MAX_POOLED_SESSIONS):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.reconnects = 0
+        self.evictions = 0
+        self._sessions: OrderedDict[str, PooledSession] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, url: str) -> ClientSession:
+        lock = self._locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            pooled = self._sessions.get(url)
+            if pooled is not None:
+                if await pooled.healthy():
+                    self.hits += 1
+                    self._sessions.move_to_end(url)
+                    return pooled.session
+
+                self.reconnects += 1
+                await self.discard(url)
+
+            self.misses += 1
+            pooled = PooledSession(url)
+            await pooled.open()
+            self._sessions[url] = pooled
+
+        while len(self._sessions) > self.max_size:
+            _, evicted = self._sessions.popitem(last=False)
+            self.evictions += 1
+            await evicted.close()
+
+        return pooled.session
+
+    async def discard(self, url: str):
+        pooled = self._sessions.pop(url, None)
+        if pooled is not None:
+            await pooled.close()
+
+    async def close(self):
+        for url in list(self._sessions):
+            await self.discard(url)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._sessions),
+            "hits": self.hits,
+            "misses": self.misses,
+            "reconnects": self.reconnects,
+            "evictions": self.evictions,
+        }
+
+
+pool = McpSessionPool()
+
 
 @asynccontextmanager
 async def mcp_session(url: str):
-    async with sse_client(url) as (read, write), ClientSession(read, write) as session:
-        await session.initialize()
+    session = await pool.acquire(url)
+    try:
         yield session
+    except CONNECTION_ERRORS:
+        # Drop the broken connection so the next call reconnects
+        await pool.discard(url)
+        raise
+    except McpError as e:
+        if e.error.code == CONNECTION_CLOSED:
+            await pool.discard(url)
+        raise
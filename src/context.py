@@ -0,0 +1,172 @@
+import posixpath
+import re
+from collections import deque
+
+from .snapshot import content_hash
+
+CONTEXT_TOKEN_BUDGET = 24_000
+ENTRY_POINTS = ("/app/src/App.tsx",)
+SOURCE_ROOT = "/app/src"
+
+# Matches `import x from "y"`, `import "y"`, `export { x } from "y"` and `import("y")`
+IMPORT_PATTERN = re.compile(
+    r"""(?:\bimport\s+(?:[^'"`;]*?\s+from\s+)?|\bexport\s+[^'"`;]*?\s+from\s+|\bimport\s*\(\s*)['"]([^'"]+)['"]"""
+)
+RESOLVE_SUFFIXES = ("", ".tsx", ".ts", ".jsx", ".js", "/index.tsx", "/index.ts", "/index.js")
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def parse_imports(content: str) -> list[str]:
+    return IMPORT_PATTERN.findall(content)
+
+
+class ImportGraph:
+    """
+    Import graph over the project sources, updated incrementally: a file is only
+    re-parsed when its content hash changes.
+    """
+
+    def __init__(self):
+        self.imports: dict[str, set[str]] = {}
+        self._hashes: dict[str, str] = {}
+        self._specifiers: dict[str, list[str]] = {}
+
+    def sync(self, code_map: dict[str, str]):
+        for path in set(self._hashes) - set(code_map):
+            del self._hashes[path]
+            del self._specifiers[path]
+
+        for path, content in code_map.items():
+            digest = content_hash(content)
+            if self._hashes.get(path) != digest:
+                self._hashes[path] = digest
+                self._specifiers[path] = parse_imports(content)
+
+        # Resolution depends on which files exist, so redo it for every file
+        self.imports = {
+            path: {
+                resolved
+                for specifier in specifiers
+                if (resolved := self.resolve(path, specifier)) is not None
+            }
+            for path, specifiers in self._specifiers.items()
+        }
+
+    def size(self) -> int:
+        """Approximate bytes held by the parsed specifiers and content hashes"""
+        return sum(
+            len(path) + len(self._hashes[path]) + sum(map(len, specifiers))
+            for path, specifiers in self._specifiers.items()
+        )
+
+    def resolve(self, importer: str, specifier: str) -> str | None:
+        if specifier.startswith("@/"):
+            base = posixpath.join(SOURCE_ROOT, specifier[2:])
+        elif specifier.startswith("."):
+            base = posixpath.normpath(
+                posixpath.join(posixpath.dirname(importer), specifier)
+            )
+        else:
+            # Package import
+            return None
+
+        for suffix in RESOLVE_SUFFIXES:
+            if base + suffix in self._hashes:
+                return base + suffix
+        return None
+
+    def reachable(self, seeds: list[str]) -> list[str]:
+        """Files reachable from `seeds`, nearest first"""
+        order = []
+        seen = set()
+        queue = deque(seed for seed in seeds if seed in self.imports)
+        while queue:
+            path = queue.popleft()
+            if path in seen:
+                continue
+            seen.add(path)
+            order.append(path)
+            queue.extend(sorted(self.imports[path] - seen))
+        return order
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", text.lower())
+
+
+def edit_targets(
+    code_map: dict[str, str], feedback: str, recent: list[str] = ()
+) -> list[str]:
+    """
+    Guess which files an edit will touch: files named in the feedback, then the
+    files edited last turn. The entry point is only a fallback when neither
+    matched, since its imports reach most of the app.
+    """
+    wanted = _normalize(feedback)
+    mentioned = [
+        path
+        for path in sorted(code_map)
+        if len(stem := _normalize(posixpath.splitext(posixpath.basename(path))[0])) >= 3
+        and stem in wanted
+    ]
+
+    targets = []
+    for path in [*mentioned, *recent]:
+        if path in code_map and path not in targets:
+            targets.append(path)
+    if not targets:
+        targets = [path for path in ENTRY_POINTS if path in code_map]
+    return targets
+
+
+def select_context(
+    graph: ImportGraph,
+    code_map: dict[str, str],
+    targets: list[str],
+    *,
+    token_budget: int = CONTEXT_TOKEN_BUDGET,
+) -> dict[str, str]:
+    """
+    Pick the files reachable from the edit targets that fit in `token_budget`,
+    nearest first. The targets themselves are always included.
+    """
+    selected = {}
+    used = 0
+    for path in graph.reachable(targets):
+        tokens = estimate_tokens(code_map[path])
+        if path not in targets and used + tokens > token_budget:
+            continue
+        selected[path] = code_map[path]
+        used += tokens
+    return selected
+
+
+def omitted_content(content: str) -> str:
+    """Placeholder shown to the model for a source file select_context left out"""
+    return (
+        f"[Source file, ~{estimate_tokens(content)} tokens, left out as unrelated "
+        "to this edit. Content not shown; you may import it, but do not edit it.]"
+    )
+
+
+def context_files(
+    code_map: dict[str, str], context_map: dict[str, str]
+) -> list[dict[str, str]]:
+    """
+    EditCode's code_files: the selected files in full, then every other source
+    file by path only, so the model still knows the whole project layout.
+    Each group is sorted to keep the prompt prefix stable for caching.
+    """
+    files = [
+        {"path": path, "content": content}
+        for path, content in sorted(context_map.items())
+    ]
+    files.extend(
+        {"path": path, "content": omitted_content(content)}
+        for path, content in sorted(code_map.items())
+        if path not in context_map
+    )
+    return files
@@ -0,0 +1,82 @@
+import asyncio
+import functools
+import os
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+# Threads shared by all blocking sandbox tools
+TOOL_WORKERS = int(os.getenv("TOOL_WORKERS", "64"))
+# Per-tool caps within TOOL_WORKERS, so one slow tool can't take every thread
+TOOL_CONCURRENCY = {
+    "create_app_environment": 8,
+    "load_code": 24,
+    "edit_code": 24,
+    "patch_code": 24,
+    "code_version": 32,
+}
+DEFAULT_TOOL_CONCURRENCY = 8
+
+
+class ToolExecutor:
+    """
+    Runs blocking tool bodies on a bounded thread pool, so the MCP server's
+    event loop keeps serving other requests. Each tool name has its own
+    concurrency limit; calls over the limit wait their turn on the loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = TOOL_WORKERS,
+        limits: dict[str, int] | None = None,
+    ):
+        self.workers = workers
+        self.limits = TOOL_CONCURRENCY if limits is None else limits
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool")
+        self.active: Counter[str] = Counter()
+        self.waiting: Counter[str] = Counter()
+        self.completed: Counter[str] = Counter()
+        self.failed: Counter[str] = Counter()
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, name: str) -> asyncio.Semaphore:
+        if name not in self._semaphores:
+            limit = self.limits.get(name, DEFAULT_TOOL_CONCURRENCY)
+            self._semaphores[name] = asyncio.Semaphore(limit)
+        return self._semaphores[name]
+
+    async def run(self, name: str, fn: Callable, *args, **kwargs):
+        admitted = False
+        self.waiting[name] += 1
+        try:
+            async with self._semaphore(name):
+                admitted = True
+                self.waiting[name] -= 1
+                self.active[name] += 1
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(
+                        self.pool, functools.partial(fn, *args, **kwargs)
+                    )
+                except BaseException:
+                    self.failed[name] += 1
+                    raise
+                finally:
+                    self.active[name] -= 1
+                    self.completed[name] += 1
+        finally:
+            # Cancelled while still waiting for a slot
+            if not admitted:
+                self.waiting[name] -= 1
+
+    def stats(self) -> dict:
+        return {
+            name: {
+                "limit": self.limits.get(name, DEFAULT_TOOL_CONCURRENCY),
+                "active": self.active[name],
+                "waiting": self.waiting[name],
+                "completed": self.completed[name],
+                "failed": self.failed[name],
+            }
+            for name in sorted({*self.limits, *self.completed, *self.waiting})
+        }
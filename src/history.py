@@ -0,0 +1,100 @@
+from collections import deque
+
+from .context import estimate_tokens
+
+HISTORY_TOKEN_BUDGET = 8_000
+SUMMARY_TOKEN_BUDGET = 1_000
+RECENT_TURNS = 4
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+def summarize_turn(feedback: str, plan: str) -> str:
+    # The opening paragraph of a plan says what was built; the rest is detail
+    overview = plan.strip().split("\n\n", 1)[0]
+    return f"- User: {_clip(feedback, 200)}\n  Assistant: {_clip(overview, 300)}"
+
+
+class History:
+    """
+    Conversation history for one session. The last `recent_turns` turns are kept
+    verbatim; once the history goes over `token_budget` (or `max_bytes`) older
+    turns are folded into a rolling summary, which is itself capped at
+    `summary_token_budget` by dropping its oldest lines.
+    """
+
+    def __init__(
+        self,
+        *,
+        token_budget: int = HISTORY_TOKEN_BUDGET,
+        summary_token_budget: int = SUMMARY_TOKEN_BUDGET,
+        recent_turns: int = RECENT_TURNS,
+        max_bytes: int | None = None,
+    ):
+        self.token_budget = token_budget
+        self.summary_token_budget = summary_token_budget
+        self.recent_turns = recent_turns
+        self.max_bytes = max_bytes
+        self.turns: deque[tuple[str, str]] = deque()
+        self.summary_lines: deque[str] = deque()
+        self._summary_tokens = 0
+
+    def add(self, feedback: str, plan: str):
+        self.turns.append((feedback, plan))
+
+        while len(self.turns) > 1 and (
+            self._over_byte_cap()
+            or (len(self.turns) > self.recent_turns and self._over_token_budget())
+        ):
+            self._fold(*self.turns.popleft())
+
+    def messages(self) -> list[dict]:
+        messages = []
+        if self.summary_lines:
+            messages.append(
+                {
+                    "role": "system",
+                    "content": SUMMARY_PREFIX + "\n".join(self.summary_lines),
+                }
+            )
+
+        for feedback, plan in self.turns:
+            messages.append({"role": "user", "content": feedback})
+            messages.append({"role": "assistant", "content": plan})
+        return messages
+
+    def tokens(self) -> int:
+        return self._summary_tokens + sum(
+            estimate_tokens(feedback) + estimate_tokens(plan)
+            for feedback, plan in self.turns
+        )
+
+    def size(self) -> int:
+        return sum(len(line.encode("utf-8")) for line in self.summary_lines) + sum(
+            len(feedback.encode("utf-8")) + len(plan.encode("utf-8"))
+            for feedback, plan in self.turns
+        )
+
+    def _over_token_budget(self) -> bool:
+        return self.tokens() > self.token_budget
+
+    def _over_byte_cap(self) -> bool:
+        return self.max_bytes is not None and self.size() > self.max_bytes
+
+    def _fold(self, feedback: str, plan: str):
+        line = summarize_turn(feedback, plan)
+        self.summary_lines.append(line)
+        self._summary_tokens += estimate_tokens(line)
+
+        while len(self.summary_lines) > 1 and (
+            self._summary_tokens > self.summary_token_budget
+        ):
+            self._summary_tokens -= estimate_tokens(self.summary_lines.popleft())
+
+    def __len__(self) -> int:
+        return len(self.turns)
@@ -0,0 +1,137 @@
+import io
+import tarfile
+import uuid
+from pathlib import Path
+
+from .manifest import (
+    diff_manifest,
+    filter_reason,
+    is_binary,
+    make_stub,
+    manifest_command,
+    parse_manifest,
+    stub_from_content,
+)
+from .transfer import download_bytes
+
+DEFAULT_PROJECT_ROOT = "/app"
+DEFAULT_CODE_PATH = f"{DEFAULT_PROJECT_ROOT}/src"
+# Paths under the project root that load_code fetches
+ARCHIVE_MEMBERS = ("src", "package.json")
+
+
+def _fetch_manifest(sandbox, root: str) -> dict[str, dict]:
+    process = sandbox.process.exec("sh", "-c", manifest_command(root, ARCHIVE_MEMBERS))
+    process.wait()
+    return parse_manifest(process.stdout.read(), root)
+
+
+def _fetch_archive(
+    sandbox, paths: list[str], root: str, size: int | None = None
+) -> dict[str, bytes]:
+    """Fetch the given files as one tar archive of at most about `size` bytes"""
+    archive_path = f"/tmp/mojocode-src-{uuid.uuid4().hex}.tar.gz"
+    members = [path[len(root) + 1 :] for path in paths]
+    process = sandbox.process.exec("tar", "-czf", archive_path, "-C", root, *members)
+    exit_code = process.wait()
+    if exit_code != 0:
+        raise RuntimeError(f"tar exited with {exit_code}")
+
+    try:
+        data = download_bytes(sandbox, archive_path, size)
+    finally:
+        # Don't wait on the cleanup
+        sandbox.process.exec("rm", "-f", archive_path)
+
+    contents = {}
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+        for member in tar:
+            if member.isfile():
+                path = f"{root}/{member.name}"
+                contents[path] = tar.extractfile(member).read()
+    return contents
+
+
+def load_archive(
+    sandbox, known: dict[str, dict] | None, root: str = DEFAULT_PROJECT_ROOT
+) -> dict:
+    """
+    List the tree with sizes, hashes and binary flags in one exec, then fetch
+    the files that changed since `known` (all of them without it) and pass the
+    filter policy, in one archive
+    """
+    package_json_path = f"{root}/package.json"
+    manifest = _fetch_manifest(sandbox, root)
+    if package_json_path not in manifest:
+        raise RuntimeError("Manifest is missing package.json")
+
+    if known is None:
+        changed, deleted = list(manifest), []
+    else:
+        changed, deleted = diff_manifest(known, manifest)
+
+    wanted = []
+    stubs = {}
+    for path in changed:
+        entry = manifest[path]
+        reason = None
+        if path != package_json_path:
+            reason = filter_reason(path, entry["size"], entry["binary"])
+
+        if reason is None:
+            wanted.append(path)
+        else:
+            stubs[path] = make_stub(entry["size"], entry["hash"], reason)
+
+    # The files' total size bounds the compressed archive's
+    size = sum(manifest[path]["size"] for path in wanted)
+    contents = _fetch_archive(sandbox, wanted, root, size) if wanted else {}
+    package_json = contents.pop(package_json_path, None)
+    return {
+        "files": {
+            path: content.decode("utf-8", errors="replace")
+            for path, content in contents.items()
+        },
+        "package_json": package_json.decode("utf-8") if package_json else None,
+        "stubs": stubs,
+        "deleted": deleted,
+        "manifest": manifest,
+        "incremental": known is not None,
+    }
+
+
+def load_files(sandbox, root: str = DEFAULT_PROJECT_ROOT) -> dict:
+    """Walk the source tree, one download per file"""
+    file_map = {}
+    stubs = {}
+
+    def _process_directory(dir_path: str):
+        for file in sandbox.fs.list_files(dir_path):
+            full_path = Path(dir_path) / file.name
+
+            if file.is_dir:
+                # Recursively process subdirectories
+                _process_directory(str(full_path))
+            else:
+                # Download file
+                content = download_bytes(sandbox, str(full_path))
+                reason = filter_reason(
+                    str(full_path), len(content), is_binary(content)
+                )
+                if reason is None:
+                    file_map[str(full_path)] = content.decode("utf-8")
+                else:
+                    stubs[str(full_path)] = stub_from_content(content, reason)
+
+    _process_directory(f"{root}/src")
+
+    package_json = download_bytes(sandbox, f"{root}/package.json").decode("utf-8")
+
+    return {
+        "files": file_map,
+        "package_json": package_json,
+        "stubs": stubs,
+        "deleted": [],
+        "manifest": {},
+        "incremental": False,
+    }
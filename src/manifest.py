@@ -0,0 +1,123 @@
+import fnmatch
+import hashlib
+import os
+
+# Files that load_code returns as path + size + hash stubs instead of content
+MAX_LOAD_FILE_BYTES = int(os.getenv("MAX_LOAD_FILE_BYTES", str(128 * 1024)))
+LOAD_EXCLUDE_GLOBS = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.avif",
+    "*.ico",
+    "*.bmp",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.eot",
+    "*.mp3",
+    "*.mp4",
+    "*.webm",
+    "*.wav",
+    "*.pdf",
+    "*.zip",
+    "*.gz",
+    "*.map",
+    "*.min.js",
+)
+
+
+def manifest_command(root: str, members: tuple[str, ...]) -> str:
+    """
+    Shell command listing every file under `members` (relative to `root`) in
+    one exec: "F size mtime path" lines, then sha256sum's "H hash  path" lines,
+    then "B path" for files grep considers binary (they contain NUL bytes) or
+    empty. The empty pattern matches every line, so blank-line-only text files
+    aren't listed.
+    """
+    paths = " ".join(members)
+    return (
+        f"cd {root}; "
+        f"find {paths} -type f -printf 'F %s %T@ %p\\n'; "
+        f"find {paths} -type f -print0 | xargs -0 -r sha256sum | sed 's/^/H /'; "
+        f"find {paths} -type f -print0 | xargs -0 -r grep -IL '' | sed 's/^/B /'"
+    )
+
+
+def parse_manifest(output: str, root: str) -> dict[str, dict]:
+    """Parse manifest_command's output into {absolute path: entry}"""
+    manifest: dict[str, dict] = {}
+    hashes: dict[str, str] = {}
+    binary: set[str] = set()
+
+    for line in output.splitlines():
+        kind, _, rest = line.partition(" ")
+        if kind == "F":
+            size, mtime, path = rest.split(" ", 2)
+            manifest[f"{root}/{path}"] = {"size": int(size), "mtime": float(mtime)}
+        elif kind == "H":
+            digest, path = rest.split("  ", 1)
+            hashes[f"{root}/{path}"] = digest
+        elif kind == "B":
+            binary.add(f"{root}/{rest}")
+
+    for path, entry in manifest.items():
+        entry["hash"] = hashes.get(path, "")
+        # grep -L also lists empty files
+        entry["binary"] = path in binary and entry["size"] > 0
+    return manifest
+
+
+def is_binary(content: bytes) -> bool:
+    if b"\0" in content[:8192]:
+        return True
+    try:
+        content.decode("utf-8")
+    except UnicodeDecodeError:
+        return True
+    return False
+
+
+def filter_reason(path: str, size: int, binary: bool) -> str | None:
+    """Why a file should be stubbed rather than loaded, or None to load it"""
+    name = os.path.basename(path)
+    if any(fnmatch.fnmatch(name, pattern) for pattern in LOAD_EXCLUDE_GLOBS):
+        return "excluded"
+    if binary:
+        return "binary"
+    if size > MAX_LOAD_FILE_BYTES:
+        return "too large"
+    return None
+
+
+def make_stub(size: int, digest: str, reason: str) -> dict:
+    return {"size": size, "hash": digest, "reason": reason}
+
+
+def stub_from_content(content: bytes, reason: str) -> dict:
+    return make_stub(len(content), hashlib.sha256(content).hexdigest(), reason)
+
+
+def entry_changed(known: dict | None, entry: dict) -> bool:
+    """Compare by hash when both sides have one, else by size and mtime"""
+    if known is None:
+        return True
+    if known.get("hash") and entry.get("hash"):
+        return known["hash"] != entry["hash"]
+    return known.get("size") != entry.get("size") or known.get("mtime") != entry.get(
+        "mtime"
+    )
+
+
+def diff_manifest(
+    known: dict[str, dict], manifest: dict[str, dict]
+) -> tuple[list[str], list[str]]:
+    """Paths added or changed since `known`, and paths deleted since `known`"""
+    changed = [
+        path for path, entry in manifest.items() if entry_changed(known.get(path), entry)
+    ]
+    deleted = sorted(set(known) - set(manifest))
+    return changed, deleted
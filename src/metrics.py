@@ -0,0 +1,195 @@
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+LATENCY_SAMPLES = 1000
+MAX_TRACKED_SANDBOXES = 1000
+
+
+@dataclass
+class GenerationStats:
+    """Process-wide counters for EditCode generations on this replica"""
+
+    active: int = 0
+    queued: int = 0
+    completed: int = 0
+    cancelled: int = 0
+    disconnected: int = 0
+    failed: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class TokenUsage:
+    """Token and throughput totals for EditCode calls"""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    generation_seconds: float = 0.0
+    # Time to first token, summed over calls
+    ttft: float = 0.0
+
+    def add(self, other: "TokenUsage"):
+        self.calls += other.calls
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cached_input_tokens += other.cached_input_tokens
+        self.generation_seconds += other.generation_seconds
+        self.ttft += other.ttft
+
+    @property
+    def tokens_per_second(self) -> float:
+        if not self.generation_seconds:
+            return 0.0
+        return self.output_tokens / self.generation_seconds
+
+    @property
+    def cached_ratio(self) -> float:
+        if not self.input_tokens:
+            return 0.0
+        return self.cached_input_tokens / self.input_tokens
+
+    @property
+    def mean_ttft(self) -> float:
+        if not self.calls:
+            return 0.0
+        return self.ttft / self.calls
+
+    def to_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "generation_seconds": round(self.generation_seconds, 3),
+            "ttft": round(self.ttft, 3),
+            "mean_ttft": round(self.mean_ttft, 3),
+            "tokens_per_second": round(self.tokens_per_second, 1),
+            "cached_ratio": round(self.cached_ratio, 3),
+        }
+
+
+class SandboxUsage:
+    """
+    TokenUsage totals per sandbox. Least recently used sandboxes are dropped
+    once `max_sandboxes` is reached.
+    """
+
+    def __init__(self, *, max_sandboxes: int = MAX_TRACKED_SANDBOXES):
+        self.max_sandboxes = max_sandboxes
+        self._usage: OrderedDict[str, TokenUsage] = OrderedDict()
+
+    def add(self, sandbox_id: str, usage: TokenUsage):
+        totals = self._usage.get(sandbox_id)
+        if totals is None:
+            totals = self._usage[sandbox_id] = TokenUsage()
+        self._usage.move_to_end(sandbox_id)
+        totals.add(usage)
+
+        while len(self._usage) > self.max_sandboxes:
+            self._usage.popitem(last=False)
+
+    def get(self, sandbox_id: str) -> TokenUsage:
+        return self._usage.get(sandbox_id) or TokenUsage()
+
+    def __contains__(self, sandbox_id: str) -> bool:
+        return sandbox_id in self._usage
+
+    def __len__(self) -> int:
+        return len(self._usage)
+
+
+def usage_from_collector(
+    collector, generation_seconds: float, ttft: float
+) -> TokenUsage:
+    """
+    Read the last call's usage from a baml_py Collector. For streamed calls the
+    provider reports usage, incl. cached prompt tokens, in the final chunk.
+    """
+    log = collector.last
+    usage = log.usage if log is not None else None
+    if usage is None:
+        return TokenUsage(calls=1, generation_seconds=generation_seconds, ttft=ttft)
+
+    return TokenUsage(
+        calls=1,
+        input_tokens=usage.input_tokens or 0,
+        output_tokens=usage.output_tokens or 0,
+        cached_input_tokens=usage.cached_input_tokens or 0,
+        generation_seconds=generation_seconds,
+        ttft=ttft,
+    )
+
+
+class LatencyStats:
+    """Per-stage latency percentiles over the most recent `samples` turns"""
+
+    def __init__(self, samples: int = LATENCY_SAMPLES):
+        self.samples = samples
+        self._stages: dict[str, deque[float]] = {}
+
+    def observe(self, stage: str, seconds: float):
+        if stage not in self._stages:
+            self._stages[stage] = deque(maxlen=self.samples)
+        self._stages[stage].append(seconds)
+
+    def percentile(self, stage: str, q: float) -> float:
+        values = sorted(self._stages[stage])
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    def summary(self) -> dict:
+        return {
+            stage: {
+                "count": len(values),
+                "p50": round(self.percentile(stage, 0.50), 3),
+                "p95": round(self.percentile(stage, 0.95), 3),
+                "p99": round(self.percentile(stage, 0.99), 3),
+            }
+            for stage, values in self._stages.items()
+        }
+
+
+class TurnTimer:
+    """Monotonic timings for the stages of one turn, fed into `latency_stats`"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.stages: dict[str, float] = {}
+        self.files: dict[str, float] = {}
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @contextmanager
+    def span(self, stage: str):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(stage, time.monotonic() - start)
+
+    def record(self, stage: str, seconds: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def record_file(self, path: str, seconds: float):
+        self.files[path] = seconds
+
+    def finish(self) -> dict:
+        self.record("total", self.elapsed())
+        for stage, seconds in self.stages.items():
+            latency_stats.observe(stage, seconds)
+        for seconds in self.files.values():
+            latency_stats.observe("file", seconds)
+
+        return {
+            "stages": {stage: round(s, 3) for stage, s in self.stages.items()},
+            "files": {path: round(s, 3) for path, s in self.files.items()},
+        }
+
+
+generation_stats = GenerationStats()
+latency_stats = LatencyStats()
+replica_usage = TokenUsage()
+sandbox_usage = SandboxUsage()
@@ -0,0 +1,54 @@
+class PatchError(Exception):
+    pass
+
+
+def _find_lines(content: str, search: str) -> tuple[int, int] | None:
+    """
+    Locate `search` in `content` line by line, ignoring trailing whitespace.
+    Returns the character span of the single match, or None.
+    """
+    lines = content.splitlines(keepends=True)
+    wanted = [line.rstrip() for line in search.strip("\n").splitlines()]
+    if not wanted:
+        return None
+
+    matches = [
+        i
+        for i in range(len(lines) - len(wanted) + 1)
+        if [line.rstrip() for line in lines[i : i + len(wanted)]] == wanted
+    ]
+    if len(matches) != 1:
+        return None
+
+    start = sum(len(line) for line in lines[: matches[0]])
+    end = start + sum(len(line) for line in lines[matches[0] : matches[0] + len(wanted)])
+    return start, end
+
+
+def apply_hunks(content: str, hunks: list[dict]) -> str:
+    """
+    Apply search/replace hunks in order. Every hunk has to match exactly once,
+    otherwise the whole file is rejected with a PatchError.
+    """
+    for i, hunk in enumerate(hunks):
+        search, replace = hunk.get("search") or "", hunk.get("replace") or ""
+        if not search.strip():
+            raise PatchError(f"Hunk {i} has an empty search block")
+
+        count = content.count(search)
+        if count == 1:
+            content = content.replace(search, replace, 1)
+            continue
+        if count > 1:
+            raise PatchError(f"Hunk {i} matches {count} times")
+
+        span = _find_lines(content, search)
+        if span is None:
+            raise PatchError(f"Hunk {i} does not match the file")
+
+        start, end = span
+        if not replace.endswith("\n") and content[start:end].endswith("\n"):
+            replace += "\n"
+        content = content[:start] + replace + content[end:]
+
+    return content
@@ -0,0 +1,90 @@
+import os
+import re
+from dataclasses import asdict, dataclass
+
+from baml_py import ClientRegistry
+
+# Models by route. "strong" matches OpenAIClient in build.baml
+ROUTE_MODELS = {
+    "fast": "gpt-4.1-mini",
+    "strong": "o4-mini",
+}
+
+# Feedback above this many words, or edit targets above this many tokens, is
+# treated as large, multi-file work. The targets are what the model rewrites; the
+# rest of the selected context (up to CONTEXT_TOKEN_BUDGET) is only read.
+MAX_FAST_WORDS = 40
+MAX_FAST_TARGET_TOKENS = 12_000
+MAX_FAST_TARGETS = 3
+
+LARGE_EDIT_PATTERN = re.compile(
+    r"\b(build|create|make (?:a|an|me)|new (?:page|app|feature|component)s?|"
+    r"dashboard|redesign|rewrite|refactor|from scratch|multiple|pages|routing|"
+    r"authentication|database)\b",
+    re.IGNORECASE,
+)
+SMALL_EDIT_PATTERN = re.compile(
+    r"\b(colou?r|rename|typo|text|label|title|font|size|padding|margin|spacing|"
+    r"border|background|icon|move|align|center|bigger|smaller|darker|lighter|"
+    r"tweak|change|"
+    # Colors
+    r"red|blue|green|yellow|orange|purple|violet|pink|black|white|gr[ae]y|teal|"
+    r"cyan|indigo|brown|gold|silver|"
+    # Common style words
+    r"bold|italic|underline|uppercase|lowercase|rounded|radius|shadow|opacity|"
+    r"transparent|gradient|hover|width|height|wider|narrower|taller|shorter|"
+    r"hide|show)\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class Route:
+    name: str
+    model: str
+    reason: str
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def route_edit(
+    feedback: str, *, target_tokens: int, target_count: int, has_history: bool
+) -> Route:
+    """Cheaply classify an edit as small and localized ("fast") or large ("strong")"""
+    words = len(feedback.split())
+
+    if not has_history:
+        reason = "first turn"
+    elif target_tokens > MAX_FAST_TARGET_TOKENS:
+        reason = f"edit targets of {target_tokens} tokens"
+    elif target_count > MAX_FAST_TARGETS:
+        reason = f"{target_count} edit targets"
+    elif words > MAX_FAST_WORDS:
+        reason = f"{words} words of feedback"
+    elif LARGE_EDIT_PATTERN.search(feedback):
+        reason = "asks for new or large features"
+    elif SMALL_EDIT_PATTERN.search(feedback):
+        return Route("fast", ROUTE_MODELS["fast"], "small, localized change")
+    else:
+        reason = "no small-edit signal"
+
+    return Route("strong", ROUTE_MODELS["strong"], reason)
+
+
+def client_options(route: Route) -> dict:
+    return {
+        "model": route.model,
+        "api_key": os.getenv("OPENAI_API_KEY"),
+        # The final chunk then carries usage, incl. cached prompt tokens
+        "stream_options": {"include_usage": True},
+    }
+
+
+def client_registry(route: Route) -> ClientRegistry:
+    registry = ClientRegistry()
+    registry.add_llm_client(
+        name=f"OpenAI-{route.name}", provider="openai", options=client_options(route)
+    )
+    registry.set_primary(f"OpenAI-{route.name}")
+    return registry
@@ -0,0 +1,149 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import contextmanager
+
+SANDBOX_TTL = 300
+# update_ttl runs at most once per interval per sandbox, well inside SANDBOX_TTL
+KEEPALIVE_INTERVAL = 60
+MAX_CACHED_SANDBOXES = 256
+# Reconnect handles older than this, in case the sandbox moved or went away
+MAX_HANDLE_AGE = 30 * 60
+
+
+class CachedSandbox:
+    def __init__(self, sandbox):
+        self.sandbox = sandbox
+        self.connected = time.monotonic()
+        self.last_used = self.connected
+        self.last_keepalive = self.connected
+
+    def expired(self) -> bool:
+        return time.monotonic() - self.connected > MAX_HANDLE_AGE
+
+
+class SandboxCache:
+    """
+    Connected sandbox handles by id, so tool calls skip Sandbox().connect.
+    Instead of calling update_ttl on every call, a background thread extends
+    the TTL at most once per `keepalive_interval` per sandbox: immediately when
+    a call finds it due, otherwise on the thread's periodic pass. Holds at most
+    `max_size` handles, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[str], object],
+        *,
+        max_size: int = MAX_CACHED_SANDBOXES,
+        keepalive_interval: float = KEEPALIVE_INTERVAL,
+        ttl: int = SANDBOX_TTL,
+    ):
+        self.connect = connect
+        self.max_size = max_size
+        self.keepalive_interval = keepalive_interval
+        self.ttl = ttl
+        self.handles: OrderedDict[str, CachedSandbox] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.keepalives = 0
+        self.keepalive_failures = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def get(self, sandbox_id: str):
+        self.start()
+        with self._lock:
+            cached = self.handles.get(sandbox_id)
+            if cached is not None and cached.expired():
+                del self.handles[sandbox_id]
+                cached = None
+
+            if cached is not None:
+                self.hits += 1
+                self.handles.move_to_end(sandbox_id)
+                cached.last_used = now = time.monotonic()
+                if now - cached.last_keepalive >= self.keepalive_interval:
+                    # Extend now rather than on the next pass, which could come
+                    # after the TTL has run out
+                    self._wake.set()
+                return cached.sandbox
+
+        self.misses += 1
+        sandbox = self.connect(sandbox_id)
+        # A fresh connection gets its TTL extended right away
+        sandbox.update_ttl(self.ttl)
+        self.put(sandbox_id, sandbox)
+        return sandbox
+
+    def put(self, sandbox_id: str, sandbox):
+        """Cache a handle whose TTL was just set, e.g. one we created"""
+        with self._lock:
+            self.handles[sandbox_id] = CachedSandbox(sandbox)
+            self.handles.move_to_end(sandbox_id)
+            while len(self.handles) > self.max_size:
+                self.handles.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, sandbox_id: str):
+        with self._lock:
+            if self.handles.pop(sandbox_id, None) is not None:
+                self.evictions += 1
+
+    @contextmanager
+    def use(self, sandbox_id: str):
+        """Borrow a handle, dropping it from the cache if the call fails"""
+        sandbox = self.get(sandbox_id)
+        try:
+            yield sandbox
+        except BaseException:
+            self.invalidate(sandbox_id)
+            raise
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._keep_alive, name="sandbox-keepalive", daemon=True
+            )
+            self._thread.start()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self.handles),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "keepalives": self.keepalives,
+            "keepalive_failures": self.keepalive_failures,
+        }
+
+    def _keep_alive(self):
+        while True:
+            # The periodic pass is a backstop; calls that find a sandbox due
+            # wake us right away
+            self._wake.wait(self.keepalive_interval)
+            self._wake.clear()
+
+            with self._lock:
+                due = [
+                    (sandbox_id, cached)
+                    for sandbox_id, cached in self.handles.items()
+                    if cached.last_used > cached.last_keepalive
+                    and time.monotonic() - cached.last_keepalive
+                    >= self.keepalive_interval
+                ]
+
+            for sandbox_id, cached in due:
+                try:
+                    cached.sandbox.update_ttl(self.ttl)
+                    cached.last_keepalive = time.monotonic()
+                    self.keepalives += 1
+                except Exception as e:
+                    print(f"Keep-alive failed for sandbox {sandbox_id}: {e}")
+                    self.keepalive_failures += 1
+                    self.invalidate(sandbox_id)
@@ -0,0 +1,153 @@
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+# Warm sandboxes kept ready, and how long one may sit unused before it's retired.
+# Retire before the sandbox's own keep_warm_seconds (300) would expire it.
+SANDBOX_POOL_SIZE = int(os.getenv("SANDBOX_POOL_SIZE", "2"))
+SANDBOX_POOL_MAX_IDLE = float(os.getenv("SANDBOX_POOL_MAX_IDLE", "240"))
+MAINTENANCE_INTERVAL = 15
+
+
+@dataclass
+class WarmSandbox:
+    sandbox: object
+    url: str
+    created: float = field(default_factory=time.monotonic)
+    ready: bool = False
+    ready_seconds: float | None = None
+    probed: threading.Event = field(default_factory=threading.Event)
+
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self.created
+
+    def probe_done(self, ready: bool):
+        self.ready = ready
+        if ready:
+            self.ready_seconds = time.monotonic() - self.created
+        self.probed.set()
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Wait for the readiness probe to finish, returning whether it passed"""
+        self.probed.wait(timeout)
+        return self.ready
+
+
+class SandboxPool:
+    """
+    Keeps `size` sandboxes created and running the dev server, so
+    create_app_environment can hand one out immediately. Once started (at
+    server startup), a background thread refills the pool after every hand-off
+    and retires sandboxes that sat idle longer than `max_idle`.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], WarmSandbox],
+        *,
+        size: int = SANDBOX_POOL_SIZE,
+        max_idle: float = SANDBOX_POOL_MAX_IDLE,
+    ):
+        self.create = create
+        self.size = size
+        self.max_idle = max_idle
+        self.ready: deque[WarmSandbox] = deque()
+        self.creating = 0
+        self.hits = 0
+        self.misses = 0
+        self.retired = 0
+        self.failures = 0
+        self.handoff_seconds: deque[float] = deque(maxlen=1000)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None or self.size <= 0:
+                return
+            self._thread = threading.Thread(
+                target=self._maintain, name="sandbox-pool", daemon=True
+            )
+            self._thread.start()
+
+    def acquire(self) -> tuple[WarmSandbox, bool]:
+        """Take a warm sandbox, or create one inline if the pool is empty"""
+        start = time.monotonic()
+        warm, expired = None, []
+        with self._lock:
+            while self.ready and warm is None:
+                candidate = self.ready.popleft()
+                if candidate.idle_seconds() < self.max_idle:
+                    warm = candidate
+                else:
+                    expired.append(candidate)
+        self._retire(expired)
+
+        hit = warm is not None
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+            warm = self.create()
+
+        self.handoff_seconds.append(time.monotonic() - start)
+        self._wake.set()
+        return warm, hit
+
+    def stats(self) -> dict:
+        handoffs = sorted(self.handoff_seconds)
+        total = self.hits + self.misses
+        return {
+            "size": self.size,
+            "ready": len(self.ready),
+            "creating": self.creating,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "retired": self.retired,
+            "failures": self.failures,
+            "handoff_p50": round(handoffs[len(handoffs) // 2], 3) if handoffs else 0.0,
+            "handoff_p95": (
+                round(handoffs[min(len(handoffs) - 1, int(0.95 * len(handoffs)))], 3)
+                if handoffs
+                else 0.0
+            ),
+        }
+
+    def _maintain(self):
+        while True:
+            with self._lock:
+                expired = [w for w in self.ready if w.idle_seconds() >= self.max_idle]
+                for warm in expired:
+                    self.ready.remove(warm)
+                missing = self.size - len(self.ready) - self.creating
+                self.creating += max(missing, 0)
+            self._retire(expired)
+
+            for _ in range(max(missing, 0)):
+                try:
+                    warm = self.create()
+                except Exception as e:
+                    print(f"Error creating warm sandbox: {e}")
+                    self.failures += 1
+                    warm = None
+
+                with self._lock:
+                    self.creating -= 1
+                    if warm is not None:
+                        self.ready.append(warm)
+
+            self._wake.wait(MAINTENANCE_INTERVAL)
+            self._wake.clear()
+
+    def _retire(self, expired: list[WarmSandbox]):
+        for warm in expired:
+            self.retired += 1
+            try:
+                warm.sandbox.terminate()
+            except Exception as e:
+                print(f"Error retiring sandbox: {e}")
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent import Agent
+
+
+DEFAULT_SESSION_ID = "default"
+MAX_SESSIONS = 100
+MAX_SESSION_HISTORY_BYTES = 256 * 1024
+# Code snapshots dominate a session's footprint, so the registry also caps the
+# total bytes its sessions hold, well inside the replica's 512 MiB
+MAX_SESSIONS_BYTES = 128 * 1024 * 1024
+
+
+class SessionRegistry:
+    """
+    Holds one Agent per connection so concurrent users on the same replica
+    don't share history, tools or sandbox. Least recently used sessions are
+    evicted once `max_sessions` is reached or together they hold more than
+    `max_bytes` (history, code snapshot and import graph). Sessions grow
+    between lookups, so the byte cap is enforced on every lookup.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], "Agent"],
+        *,
+        max_sessions: int = MAX_SESSIONS,
+        max_bytes: int = MAX_SESSIONS_BYTES,
+    ):
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self._sessions: OrderedDict[str, Agent] = OrderedDict()
+
+    def get(self, session_id: str) -> "Agent":
+        agent = self._sessions.get(session_id)
+        if agent is not None:
+            self._sessions.move_to_end(session_id)
+        else:
+            agent = self.factory(session_id)
+            self._sessions[session_id] = agent
+
+        self._evict()
+        return agent
+
+    def size(self) -> int:
+        return sum(agent.memory_bytes() for agent in self._sessions.values())
+
+    def _evict(self):
+        while len(self._sessions) > self.max_sessions:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            print(f"Evicted session {evicted_id}")
+
+        # The session being looked up is the most recent one and is never evicted
+        total = self.size()
+        while total > self.max_bytes and len(self._sessions) > 1:
+            evicted_id, evicted = self._sessions.popitem(last=False)
+            total -= evicted.memory_bytes()
+            print(f"Evicted session {evicted_id} to stay under {self.max_bytes} bytes")
+
+    def remove(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
@@ -0,0 +1,101 @@
+import hashlib
+from dataclasses import dataclass, field
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def stub_content(stub: dict) -> str:
+    """Placeholder shown to the model for a file load_code didn't fetch"""
+    return (
+        f"[{stub['reason']} file, {stub['size']} bytes, sha256 {stub['hash'][:12]}. "
+        "Content not shown; do not edit this file.]"
+    )
+
+
+@dataclass
+class CodeSnapshot:
+    """
+    In-memory copy of a sandbox's source tree. `version` is the token the MCP
+    server reported for the tree this snapshot matches, so a cheap version
+    check tells us whether the snapshot can be reused instead of reloading.
+    """
+
+    sandbox_id: str
+    version: str | None
+    package_json: str
+    files: dict[str, str] = field(default_factory=dict)
+    hashes: dict[str, str] = field(default_factory=dict)
+    # Files filtered out by load_code: path -> size, hash and reason
+    stubs: dict[str, dict] = field(default_factory=dict)
+    # load_code's manifest of the tree (path -> size, mtime, hash). It's sent
+    # back on the next load so only files that changed since come over.
+    manifest: dict[str, dict] = field(default_factory=dict)
+    # UTF-8 bytes held in `files`, kept up to date as files come and go
+    _files_bytes: int = field(default=0, init=False, repr=False)
+
+    @classmethod
+    def new(
+        cls, sandbox_id: str, version: str | None, result: dict
+    ) -> "CodeSnapshot":
+        snapshot = cls(
+            sandbox_id=sandbox_id,
+            version=version,
+            package_json=result.get("package_json") or "",
+        )
+        snapshot.apply_load(version, result)
+        return snapshot
+
+    def apply_load(self, version: str | None, result: dict):
+        """Apply a full or incremental load_code result"""
+        for path in result.get("deleted", []):
+            self._forget(path)
+            self.stubs.pop(path, None)
+
+        for path, stub in result.get("stubs", {}).items():
+            self._forget(path)
+            self.stubs[path] = stub
+
+        for path, content in result.get("files", {}).items():
+            self.stubs.pop(path, None)
+            self._store(path, content)
+
+        if result.get("package_json") is not None:
+            self.package_json = result["package_json"]
+        self.manifest = result.get("manifest") or {}
+        self.version = version
+
+    def update(self, code_map: dict[str, str]):
+        """Record files we wrote to the sandbox ourselves"""
+        for path, content in code_map.items():
+            self.stubs.pop(path, None)
+            self._store(path, content)
+            if self.manifest:
+                self.manifest[path] = {
+                    "size": len(content.encode("utf-8")),
+                    "hash": self.hashes[path],
+                }
+
+    def size(self) -> int:
+        """Approximate bytes held: file contents and package.json"""
+        return self._files_bytes + len(self.package_json.encode("utf-8"))
+
+    def _store(self, path: str, content: str):
+        self._forget(path)
+        self.files[path] = content
+        self.hashes[path] = content_hash(content)
+        self._files_bytes += len(content.encode("utf-8"))
+
+    def _forget(self, path: str):
+        content = self.files.pop(path, None)
+        if content is not None:
+            self._files_bytes -= len(content.encode("utf-8"))
+        self.hashes.pop(path, None)
+
+    def matches(self, sandbox_id: str, version: str | None) -> bool:
+        return (
+            self.sandbox_id == sandbox_id
+            and self.version is not None
+            and self.version == version
+        )
@@ -1,10 +1,21 @@
-import tempfile
+import io
+import tarfile
+import threading
+import time
+import uuid
 from pathlib import Path
 
-from beam import Image, Sandbox
+from beam import Image, Sandbox, env
 from beam.integrations import MCPServer
 from fastmcp import FastMCP
 
+from .executor import ToolExecutor
+from .loader import DEFAULT_CODE_PATH, DEFAULT_PROJECT_ROOT, load_archive, load_files
+from .patch import apply_hunks
+from .sandbox_cache import SANDBOX_TTL, SandboxCache
+from .sandbox_pool import SandboxPool, WarmSandbox
+from .transfer import download_bytes, upload_bytes
+
 mcp = FastMCP(name="mojocode-mcp")
 image = (
     Image()
@@ -19,14 +30,44 @@ image = (
     )
 )
 
-DEFAULT_CODE_PATH = "/app/src"
-DEFAULT_PROJECT_ROOT = "/app"
+# Unpacks an edit archive into a staging directory, then renames every file into
+# place, so the dev server sees the whole change set at once rather than files
+# as they are extracted. Parent directories are created on the way. The stage
+# lives under the project root, so each mv is a same-filesystem rename rather
+# than a copy; the trap removes it even if a step fails.
+APPLY_ARCHIVE_COMMAND = (
+    "set -e; stage=$(mktemp -d {root}/.mojocode-XXXXXX); "
+    "trap 'rm -rf \"$stage\"' EXIT; "
+    'tar -xzf {archive} -C "$stage"; rm -f {archive}; '
+    'cd "$stage"; find . -type f | while IFS= read -r f; do '
+    'mkdir -p "/$(dirname "$f")"; mv -f "$f" "/$f"; done'
+)
 
+# Fingerprint of the source tree (paths, sizes and mtimes) computed in one exec
+CODE_VERSION_COMMAND = (
+    f"find {DEFAULT_CODE_PATH} {DEFAULT_PROJECT_ROOT}/package.json -type f "
+    "-printf '%p %s %T@\\n' | sort | sha256sum | cut -d' ' -f1"
+)
+
+
+DEV_SERVER_PORT = 3000
+READY_TIMEOUT = 60
+READY_PROBE_INTERVAL = 0.25
+# Polls the dev server from inside the sandbox, so the whole probe is one exec
+READY_PROBE_COMMAND = (
+    "for i in $(seq 1 {attempts}); do "
+    "curl -s -o /dev/null http://localhost:{port} && exit 0; "
+    "sleep {interval}; done; exit 1"
+)
 
-@mcp.tool
-def create_app_environment() -> dict:
-    print("Creating app environment...")
 
+def _code_version(sandbox: Sandbox) -> str:
+    process = sandbox.process.exec("sh", "-c", CODE_VERSION_COMMAND)
+    process.wait()
+    return process.stdout.read().strip()
+
+
+def _start_sandbox() -> WarmSandbox:
     sandbox = Sandbox(
         name="mojocode-sandbox",
         cpu=1,
@@ -35,80 +76,238 @@ def create_app_environment() -> dict:
         keep_warm_seconds=300,
     ).create()
 
-    url = sandbox.expose_port(3000)
-    print(f"React app created and started successfully! Access it at: {url}")
+    url = sandbox.expose_port(DEV_SERVER_PORT)
     sandbox.process.exec(
         "sh",
         "-c",
-        "cd /app && __VITE_ADDITIONAL_SERVER_ALLOWED_HOSTS=.beam.cloud npm run dev -- --host :: --port 3000",
+        f"cd /app && __VITE_ADDITIONAL_SERVER_ALLOWED_HOSTS=.beam.cloud npm run dev -- --host :: --port {DEV_SERVER_PORT}",
     )
 
-    print("Created app environment...")
+    warm = WarmSandbox(sandbox=sandbox, url=url)
+    threading.Thread(target=_probe_ready, args=(warm,), daemon=True).start()
+    return warm
+
+
+def _probe_ready(warm: WarmSandbox, timeout: float = READY_TIMEOUT):
+    """Wait for the dev server to answer on its port"""
+    command = READY_PROBE_COMMAND.format(
+        attempts=int(timeout / READY_PROBE_INTERVAL),
+        port=DEV_SERVER_PORT,
+        interval=READY_PROBE_INTERVAL,
+    )
+    try:
+        ready = warm.sandbox.process.exec("sh", "-c", command).wait() == 0
+    except Exception as e:
+        print(f"Error probing dev server: {e}")
+        ready = False
+
+    if not ready:
+        print(f"Dev server at {warm.url} did not become ready within {timeout}s")
+    warm.probe_done(ready)
+
+
+sandbox_pool = SandboxPool(_start_sandbox)
+executor = ToolExecutor()
+sandbox_cache = SandboxCache(lambda sandbox_id: Sandbox().connect(sandbox_id))
+
+if env.is_remote():
+    # Fill the pool while the server boots, so the first create_app_environment
+    # after a deploy or cold start is already a hit
+    sandbox_pool.start()
+
+
+def _create_app_environment(wait_until_ready: bool = False) -> dict:
+    print("Creating app environment...")
+
+    start = time.monotonic()
+    warm, pooled = sandbox_pool.acquire()
+    if pooled:
+        # The sandbox may have idled for a while; give the user the full TTL
+        warm.sandbox.update_ttl(SANDBOX_TTL)
+    # Tool calls for this sandbox can skip connecting to it
+    sandbox_cache.put(warm.sandbox.sandbox_id(), warm.sandbox)
+    handoff_seconds = time.monotonic() - start
+
+    if wait_until_ready:
+        warm.wait_ready(READY_TIMEOUT)
+
+    print(f"React app created and started successfully! Access it at: {warm.url}")
+    print(f"Created app environment (pooled={pooled}, ready={warm.ready})...")
     return {
-        "url": url,
-        "sandbox_id": sandbox.sandbox_id(),
+        "url": warm.url,
+        "sandbox_id": warm.sandbox.sandbox_id(),
+        "pooled": pooled,
+        "handoff_seconds": round(handoff_seconds, 3),
+        "ready": warm.ready,
+        "ready_seconds": (
+            round(warm.ready_seconds, 3) if warm.ready_seconds is not None else None
+        ),
     }
 
 
 @mcp.tool
-def load_code(sandbox_id: str) -> tuple[dict, str]:
+async def create_app_environment(wait_until_ready: bool = False) -> dict:
+    """
+    Hand out a sandbox running the dev server. With `wait_until_ready` this
+    returns only once the preview URL answers (or the probe times out).
+    """
+    return await executor.run(
+        "create_app_environment", _create_app_environment, wait_until_ready
+    )
+
+
+@mcp.tool
+def sandbox_pool_stats() -> dict:
+    return {
+        **sandbox_pool.stats(),
+        "handle_cache": sandbox_cache.stats(),
+        "tools": executor.stats(),
+    }
+
+
+def _load_code(sandbox_id: str, manifest: dict[str, dict] | None = None) -> dict:
     print(f"Loading code for sandbox {sandbox_id}")
 
-    sandbox = Sandbox().connect(sandbox_id)
-    sandbox.update_ttl(300)
+    start = time.monotonic()
+    with sandbox_cache.use(sandbox_id) as sandbox:
+        try:
+            result = load_archive(sandbox, manifest)
+            method = "incremental" if manifest is not None else "archive"
+        except Exception as e:
+            print(f"Archive load failed, falling back to per-file downloads: {e}")
+            result = load_files(sandbox)
+            method = "per-file"
 
-    file_map = {}
+    print(
+        f"Loaded {len(result['files'])} files ({len(result['stubs'])} stubbed, "
+        f"{len(result['deleted'])} deleted) for sandbox {sandbox_id} "
+        f"in {time.monotonic() - start:.2f}s ({method})"
+    )
+    return result
 
-    def _process_directory(dir_path: str):
-        for file in sandbox.fs.list_files(dir_path):
-            full_path = Path(dir_path) / file.name
 
-            if file.is_dir:
-                # Recursively process subdirectories
-                _process_directory(str(full_path))
-            else:
-                # Download file
-                with tempfile.NamedTemporaryFile() as temp_file:
-                    sandbox.fs.download_file(str(full_path), temp_file.name)
-                    temp_file.seek(0)
-                    file_content = temp_file.read()
-                    file_map[str(full_path)] = file_content
+@mcp.tool
+async def load_code(
+    sandbox_id: str, manifest: dict[str, dict] | None = None
+) -> dict:
+    """
+    Returns the source files, package.json, stubs (path -> size, hash, reason)
+    for files that were filtered out (assets, binaries and files over
+    MAX_LOAD_FILE_BYTES) and the tree's manifest (path -> size, mtime, hash).
 
-    _process_directory(DEFAULT_CODE_PATH)
+    Given the manifest from an earlier load, only files added or changed since
+    then are returned, package_json is None if it didn't change, and `deleted`
+    lists the paths that are gone.
+    """
+    return await executor.run("load_code", _load_code, sandbox_id, manifest)
 
-    package_json = "{}"
-    with tempfile.NamedTemporaryFile() as temp_file:
-        sandbox.fs.download_file(f"{DEFAULT_PROJECT_ROOT}/package.json", temp_file.name)
-        temp_file.seek(0)
-        package_json = temp_file.read().decode("utf-8")
 
-    return file_map, package_json
+def _sandbox_code_version(sandbox_id: str) -> str:
+    with sandbox_cache.use(sandbox_id) as sandbox:
+        return _code_version(sandbox)
 
 
 @mcp.tool
-def edit_code(sandbox_id: str, code_map: dict) -> dict:
-    print(f"Editing code for sandbox {sandbox_id}")
+async def code_version(sandbox_id: str) -> str:
+    return await executor.run("code_version", _sandbox_code_version, sandbox_id)
 
-    sandbox = Sandbox().connect(sandbox_id)
-    sandbox.update_ttl(300)
 
+def _pack_files(code_map: dict) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for sandbox_path, content in code_map.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(sandbox_path.lstrip("/"))
+            info.size = len(data)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def _write_archive(sandbox: Sandbox, code_map: dict):
+    """Upload every file in one archive and move them all into place in one exec"""
+    archive_path = f"/tmp/mojocode-edit-{uuid.uuid4().hex}.tar.gz"
+    upload_bytes(sandbox, _pack_files(code_map), archive_path)
+
+    process = sandbox.process.exec(
+        "sh",
+        "-c",
+        APPLY_ARCHIVE_COMMAND.format(root=DEFAULT_PROJECT_ROOT, archive=archive_path),
+    )
+    exit_code = process.wait()
+    if exit_code != 0:
+        raise RuntimeError(f"Extracting edits exited with {exit_code}")
+
+
+def _write_file_by_file(sandbox: Sandbox, code_map: dict):
     for sandbox_path, content in code_map.items():
-        with tempfile.NamedTemporaryFile() as temp_file:
-            temp_file.write(content.encode("utf-8"))
-            temp_file.seek(0)
+        # Get parent directory and check if it exists
+        parent_dir = str(Path(sandbox_path).parent)
+        try:
+            sandbox.fs.stat_file(parent_dir)
+        except BaseException:
+            # Parent directory doesn't exist, create it
+            print(f"Creating parent directory: {parent_dir}")
+            sandbox.process.exec("mkdir", "-p", parent_dir).wait()
+
+        upload_bytes(sandbox, content.encode("utf-8"), sandbox_path)
+
+
+def _write_files(sandbox: Sandbox, code_map: dict):
+    if not code_map:
+        return
 
-            # Get parent directory and check if it exists
-            parent_dir = str(Path(sandbox_path).parent)
+    try:
+        _write_archive(sandbox, code_map)
+    except Exception as e:
+        print(f"Archive write failed, falling back to per-file uploads: {e}")
+        _write_file_by_file(sandbox, code_map)
+
+
+def _edit_code(sandbox_id: str, code_map: dict) -> dict:
+    print(f"Editing code for sandbox {sandbox_id}")
+
+    with sandbox_cache.use(sandbox_id) as sandbox:
+        _write_files(sandbox, code_map)
+
+        return {"sandbox_id": sandbox.sandbox_id(), "version": _code_version(sandbox)}
+
+
+@mcp.tool
+async def edit_code(sandbox_id: str, code_map: dict) -> dict:
+    return await executor.run("edit_code", _edit_code, sandbox_id, code_map)
+
+
+def _patch_code(sandbox_id: str, edits: dict[str, list[dict]]) -> dict:
+    print(f"Patching code for sandbox {sandbox_id}")
+
+    with sandbox_cache.use(sandbox_id) as sandbox:
+        patched = {}
+        failed = {}
+        for sandbox_path, hunks in edits.items():
             try:
-                sandbox.fs.stat_file(parent_dir)
-            except BaseException:
-                # Parent directory doesn't exist, create it
-                print(f"Creating parent directory: {parent_dir}")
-                sandbox.process.exec("mkdir", "-p", parent_dir).wait()
+                content = download_bytes(sandbox, sandbox_path).decode("utf-8")
+                patched[sandbox_path] = apply_hunks(content, hunks)
+            except Exception as e:
+                failed[sandbox_path] = str(e)
 
-            sandbox.fs.upload_file(temp_file.name, sandbox_path)
+        _write_files(sandbox, patched)
 
-    return {"sandbox_id": sandbox.sandbox_id()}
+        return {
+            "sandbox_id": sandbox.sandbox_id(),
+            "files": patched,
+            "failed": failed,
+            "version": _code_version(sandbox),
+        }
+
+
+@mcp.tool
+async def patch_code(sandbox_id: str, edits: dict[str, list[dict]]) -> dict:
+    """
+    Apply search/replace hunks to files in the sandbox. Files whose hunks don't
+    all apply are left untouched and reported in `failed`.
+    """
+    return await executor.run("patch_code", _patch_code, sandbox_id, edits)
 
 
 s = MCPServer(
@@ -117,5 +316,6 @@ s = MCPServer(
     cpu=1,
     memory=1024,
     keep_warm_seconds=600,
+    # Blocking sandbox calls run on `executor`, bounded per tool by TOOL_CONCURRENCY
     concurrent_requests=1000
 )
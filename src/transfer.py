@@ -0,0 +1,61 @@
+import errno
+import os
+import tempfile
+from pathlib import Path
+
+# The Beam SDK moves files by local path, so transfers are staged in tmpfs when
+# it's available. That keeps them in memory instead of on the container's disk.
+MEMORY_DIR = "/dev/shm"
+# Larger payloads go to the regular temp dir rather than pinning memory
+MAX_MEMORY_TRANSFER_BYTES = 16 * 1024 * 1024
+
+
+def staging_dir(size: int | None = None) -> str | None:
+    """Where to stage a transfer of `size` bytes; None means the default temp dir"""
+    if size is not None and size > MAX_MEMORY_TRANSFER_BYTES:
+        return None
+    return MEMORY_DIR if os.access(MEMORY_DIR, os.W_OK) else None
+
+
+def _download(sandbox, sandbox_path: str, directory: str | None) -> bytes:
+    with tempfile.NamedTemporaryFile(dir=directory) as staged:
+        sandbox.fs.download_file(sandbox_path, staged.name)
+        return Path(staged.name).read_bytes()
+
+
+def download_bytes(sandbox, sandbox_path: str, size: int | None = None) -> bytes:
+    """
+    Download a file from the sandbox. `size` is its expected size, if known:
+    larger downloads are staged on disk. A download of unknown size that runs
+    tmpfs out of space is retried on disk.
+    """
+    directory = staging_dir(size)
+    try:
+        return _download(sandbox, sandbox_path, directory)
+    except OSError as e:
+        if directory is None or e.errno != errno.ENOSPC:
+            raise
+        print(f"No space left in {directory} for {sandbox_path}, staging on disk")
+        return _download(sandbox, sandbox_path, None)
+
+
+def _upload(sandbox, data: bytes, sandbox_path: str, directory: str | None):
+    with tempfile.NamedTemporaryFile(dir=directory) as staged:
+        staged.write(data)
+        staged.flush()
+        sandbox.fs.upload_file(staged.name, sandbox_path)
+
+
+def upload_bytes(sandbox, data: bytes, sandbox_path: str):
+    """
+    Upload `data` to the sandbox. If concurrent transfers have run tmpfs out of
+    space, the upload is retried on disk.
+    """
+    directory = staging_dir(len(data))
+    try:
+        _upload(sandbox, data, sandbox_path, directory)
+    except OSError as e:
+        if directory is None or e.errno != errno.ENOSPC:
+            raise
+        print(f"No space left in {directory} for {sandbox_path}, staging on disk")
+        _upload(sandbox, data, sandbox_path, None)
@@ -0,0 +1,87 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+MAX_PENDING_WRITES = 8
+
+
+class SandboxWriter:
+    """
+    Pushes file changes (new content, or a list of hunks) to the sandbox in the
+    background while the model is still generating. Changes queued while a
+    write is in flight are coalesced into the next `write` call, and `put`
+    blocks once `max_pending` changes are waiting. If a write fails, `put` and
+    `close` raise its exception.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[dict], Awaitable],
+        *,
+        max_pending: int = MAX_PENDING_WRITES,
+    ):
+        self.write = write
+        self.queue: asyncio.Queue[tuple[str, str | list] | None] = asyncio.Queue(
+            maxsize=max_pending
+        )
+        self.files_written = 0
+        self.write_seconds = 0.0
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def put(self, path: str, change: str | list):
+        await self._enqueue((path, change))
+
+    async def close(self) -> float:
+        """Flush pending writes, returning how long we had to wait for them"""
+        start = time.monotonic()
+        await self._enqueue(None)
+        await self._task
+        return time.monotonic() - start
+
+    async def _enqueue(self, item: tuple[str, str | list] | None):
+        """
+        Queue `item`, re-raising the write task's error if it failed, instead of
+        waiting forever on a full queue that nothing drains anymore
+        """
+        self._raise_if_failed()
+        put = asyncio.ensure_future(self.queue.put(item))
+        try:
+            await asyncio.wait({put, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not put.done():
+                put.cancel()
+        self._raise_if_failed()
+
+    def _raise_if_failed(self):
+        if self._task.done() and not self._task.cancelled():
+            # Raises the task's exception, if any
+            self._task.result()
+
+    def cancel(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    async def _run(self):
+        closed = False
+        while not closed:
+            batch = {}
+            item = await self.queue.get()
+            while True:
+                if item is None:
+                    closed = True
+                    break
+
+                path, change = item
+                batch[path] = change
+                if self.queue.empty():
+                    break
+                item = self.queue.get_nowait()
+
+            if batch:
+                start = time.monotonic()
+                await self.write(batch)
+                self.write_seconds += time.monotonic() - start
+                self.files_written += len(batch)
@@ -0,0 +1,149 @@
+"""
+CANCEL and client disconnects must abort the LLM request without stalling the
+event loop. The stream is a real BamlStream driven by a fake request that keeps
+producing partials until its AbortController fires, so closing the stream
+before the request ends would join its thread on the loop for up to 5 s.
+
+Run from the repo root with `python -m pytest tests`.
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("baml_py")
+pytest.importorskip("beam")
+
+from baml_py.errors import BamlAbortError
+from baml_py.stream import BamlStream
+
+from src import agent as agent_module
+from src.admission import AdmissionQueue
+
+MAX_LOOP_LAG = 0.5
+
+# BamlStream re-raises the aborted request's error in its thread, as it does for
+# a real aborted request
+pytestmark = pytest.mark.filterwarnings(
+    "ignore::pytest.PytestUnhandledThreadExceptionWarning"
+)
+
+
+class FakeRequest:
+    """Stands in for the FFI stream behind BamlStream: an endless request"""
+
+    def __init__(self, abort):
+        self.abort = abort
+        self.callback = None
+
+    def on_event(self, callback):
+        self.callback = callback
+        return self
+
+    async def done(self, _ctx_manager):
+        plan = ""
+        while not self.abort.aborted:
+            plan += "step. "
+            if self.callback is not None:
+                self.callback(SimpleNamespace(is_ok=lambda: True, plan=plan))
+            await asyncio.sleep(0.02)
+        raise BamlAbortError("Operation was aborted")
+
+
+def partial(result):
+    return SimpleNamespace(
+        plan=SimpleNamespace(value=result.plan, state="Incomplete"),
+        files=[],
+        edits=[],
+    )
+
+
+class FakeClient:
+    def __init__(self):
+        self.aborts = []
+        self.stream = SimpleNamespace(EditCode=self.edit_code)
+
+    def edit_code(self, *_args, baml_options):
+        abort = baml_options["abort_controller"]
+        self.aborts.append(abort)
+        return BamlStream(FakeRequest(abort), partial, partial, None)
+
+
+class LoopLag:
+    """Longest gap between ticks of a task that wakes every 10 ms"""
+
+    def __init__(self):
+        self.max = 0.0
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(0.01)
+            self.max = max(self.max, time.monotonic() - start - 0.01)
+
+    def stop(self):
+        self._task.cancel()
+
+
+def make_agent(monkeypatch):
+    monkeypatch.setattr(agent_module, "client_registry", lambda _route: None)
+    agent = agent_module.Agent(
+        mcp_url=None, session_id="session", generation_queue=AdmissionQueue(1)
+    )
+    agent.model_client = FakeClient()
+    agent.init_data = {"sandbox_id": "default"}
+    return agent
+
+
+async def settle():
+    # Give the aborted request time to wind down while we watch the loop
+    deadline = time.monotonic() + 2
+    while agent_module._draining and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(0.1)
+
+
+def test_cancel_aborts_without_stalling_the_loop(monkeypatch):
+    agent = make_agent(monkeypatch)
+    types: list[str] = []
+
+    async def main():
+        lag = LoopLag()
+        async for message in agent.send_feedback("build a full dashboard"):
+            types.append(message["type"])
+            if message["type"] == agent_module.MessageType.AGENT_PARTIAL.value:
+                agent.cancel()
+        await settle()
+        lag.stop()
+        return lag.max
+
+    max_lag = asyncio.run(asyncio.wait_for(main(), timeout=10))
+
+    assert types[-1] == agent_module.MessageType.CANCEL.value
+    assert agent.model_client.aborts[0].aborted
+    assert not agent_module._draining
+    assert max_lag < MAX_LOOP_LAG
+
+
+def test_disconnect_aborts_without_stalling_the_loop(monkeypatch):
+    agent = make_agent(monkeypatch)
+
+    async def main():
+        lag = LoopLag()
+        stream = agent.send_feedback("build a full dashboard")
+        async for message in stream:
+            if message["type"] == agent_module.MessageType.AGENT_PARTIAL.value:
+                break
+        # What the server does when the client goes away mid-turn
+        await stream.aclose()
+        await settle()
+        lag.stop()
+        return lag.max
+
+    max_lag = asyncio.run(asyncio.wait_for(main(), timeout=10))
+
+    assert agent.model_client.aborts[0].aborted
+    assert not agent_module._draining
+    assert max_lag < MAX_LOOP_LAG
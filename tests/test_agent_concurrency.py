@@ -0,0 +1,91 @@
+"""
+Concurrent turns from several sessions must stream side by side: with an async
+EditCode stream, one session's partials shouldn't wait for another's to finish.
+
+Run from the repo root with `python -m pytest tests`.
+"""
+import asyncio
+from itertools import pairwise
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("baml_py")
+pytest.importorskip("beam")
+
+from src import agent as agent_module
+from src.admission import AdmissionQueue
+
+SESSIONS = 4
+PARTIALS = 5
+
+
+class FakeStream:
+    """Stands in for BamlAsyncClient.stream.EditCode's BamlStream"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def __aiter__(self):
+        plan = ""
+        for i in range(PARTIALS):
+            await asyncio.sleep(self.delay)
+            plan += f"step {i}. "
+            yield SimpleNamespace(
+                plan=SimpleNamespace(value=plan, state="Incomplete"),
+                files=[],
+                edits=[],
+            )
+        yield SimpleNamespace(
+            plan=SimpleNamespace(value=plan, state="Complete"), files=[], edits=[]
+        )
+
+
+class FakeClient:
+    def __init__(self, delay: float = 0.01):
+        self.stream = SimpleNamespace(
+            EditCode=lambda *_args, **_kwargs: FakeStream(delay)
+        )
+
+
+def test_sessions_stream_concurrently(monkeypatch):
+    # No model registry or MCP server needed for a fake stream
+    monkeypatch.setattr(agent_module, "client_registry", lambda _route: None)
+
+    generation_queue = AdmissionQueue(SESSIONS)
+    agents = []
+    for i in range(SESSIONS):
+        agent = agent_module.Agent(
+            mcp_url=None,
+            session_id=f"session-{i}",
+            generation_queue=generation_queue,
+        )
+        agent.model_client = FakeClient()
+        agent.init_data = {"sandbox_id": "default"}
+        agents.append(agent)
+
+    partials: list[str] = []
+    completed: list[str] = []
+
+    async def run(agent):
+        async for message in agent.send_feedback("make the button red"):
+            if message["type"] == agent_module.MessageType.AGENT_PARTIAL.value:
+                partials.append(agent.session_id)
+            elif message["type"] == agent_module.MessageType.UPDATE_COMPLETED.value:
+                completed.append(agent.session_id)
+
+    async def main():
+        await asyncio.wait_for(asyncio.gather(*map(run, agents)), timeout=10)
+
+    asyncio.run(main())
+
+    assert sorted(completed) == sorted(agent.session_id for agent in agents)
+    assert len(partials) == SESSIONS * PARTIALS
+
+    # Serialized turns would switch sessions only SESSIONS - 1 times
+    switches = sum(1 for a, b in pairwise(partials) if a != b)
+    assert switches > SESSIONS - 1
+
+    # Every session had streamed something before any session finished its plan
+    first_partial = {session: partials.index(session) for session in set(partials)}
+    assert max(first_partial.values()) < PARTIALS
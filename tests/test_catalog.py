@@ -0,0 +1,99 @@
+"""
+The tool catalog only counts as loaded once a server answered, and servers that
+failed discovery are retried on a backoff.
+
+Run from the repo root with `python -m pytest tests`.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from src import catalog as catalog_module
+from src.catalog import ToolCatalog
+
+
+class FakeServers:
+    """Stands in for ToolCatalog._list_tools; `down` servers fail discovery"""
+
+    def __init__(self, down: set[str]):
+        self.down = down
+        self.calls: list[str] = []
+
+    async def list_tools(self, server_type: str, _url: str):
+        self.calls.append(server_type)
+        if server_type in self.down:
+            return None
+        return [f"{server_type}-tool"]
+
+
+@pytest.fixture
+def servers(monkeypatch):
+    for env_var in catalog_module.ADDITIONAL_SERVERS.values():
+        monkeypatch.delenv(env_var, raising=False)
+    monkeypatch.setenv("THINKING_MCP_URL", "http://thinking")
+    return FakeServers(down=set())
+
+
+def make_catalog(monkeypatch, servers, **kwargs) -> ToolCatalog:
+    catalog = ToolCatalog("http://main", **kwargs)
+    monkeypatch.setattr(catalog, "_list_tools", servers.list_tools)
+    return catalog
+
+
+def test_not_loaded_until_a_server_answers(monkeypatch, servers):
+    servers.down = {"main", "thinking"}
+    catalog = make_catalog(monkeypatch, servers, retry_backoff=60)
+
+    async def main():
+        assert await catalog.get() == []
+        assert catalog.loaded_at is None
+
+        # Within the backoff nothing is retried
+        servers.calls.clear()
+        assert await catalog.get() == []
+        assert servers.calls == []
+
+    asyncio.run(main())
+
+
+def test_failed_servers_are_retried_after_the_backoff(monkeypatch, servers):
+    servers.down = {"thinking"}
+    catalog = make_catalog(monkeypatch, servers, retry_backoff=0)
+
+    async def main():
+        assert await catalog.get() == ["main-tool"]
+        loaded_at = catalog.loaded_at
+        assert loaded_at is not None
+
+        servers.down = set()
+        servers.calls.clear()
+        await catalog.get()
+        await catalog._refresh_task
+
+        # Only the failed server is queried, and the catalog's age is unchanged
+        assert servers.calls == ["thinking"]
+        assert catalog.loaded_at == loaded_at
+        assert sorted(await catalog.get()) == ["main-tool", "thinking-tool"]
+
+    asyncio.run(main())
+
+
+def test_backoff_doubles_up_to_the_ttl(monkeypatch, servers):
+    servers.down = {"thinking"}
+    catalog = make_catalog(monkeypatch, servers, ttl=30, retry_backoff=10)
+
+    async def main():
+        delays = []
+        for _ in range(3):
+            before = catalog_module.time.monotonic()
+            await catalog._refresh(["thinking"])
+            delays.append(catalog._retry_at["thinking"] - before)
+        return delays
+
+    delays = asyncio.run(main())
+
+    assert delays[0] == pytest.approx(10, abs=0.5)
+    assert delays[1] == pytest.approx(20, abs=0.5)
+    assert delays[2] == pytest.approx(30, abs=0.5)
@@ -0,0 +1,113 @@
+"""
+Token usage for streamed EditCode calls, read from a recorded OpenAI stream
+replayed by a local server. The final chunk reports cached prompt tokens, and
+they must end up in the TokenUsage we record for the turn.
+
+Run from the repo root with `python -m pytest tests`.
+"""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+pytest.importorskip("baml_py")
+
+from baml_py import ClientRegistry, Collector
+
+from baml_client.async_client import b
+from src import router
+from src.metrics import SandboxUsage, TokenUsage, usage_from_collector
+
+RECORDED_STREAM = Path(__file__).parent / "fixtures" / "edit_code_stream.sse"
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    requests: ClassVar[list[dict]] = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.requests.append(json.loads(body))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        self.wfile.write(RECORDED_STREAM.read_bytes())
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def openai_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ReplayHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+
+
+def test_streamed_usage_includes_cached_tokens(monkeypatch, openai_url):
+    # The router's client, pointed at the replay server
+    def local_registry(route):
+        registry = ClientRegistry()
+        options = router.client_options(route)
+        registry.add_llm_client(
+            name=f"OpenAI-{route.name}",
+            provider="openai",
+            options={**options, "base_url": openai_url},
+        )
+        registry.set_primary(f"OpenAI-{route.name}")
+        return registry
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    route = router.route_edit(
+        "make the button red", target_tokens=2_000, target_count=1, has_history=True
+    )
+    collector = Collector(name="EditCode")
+
+    async def main():
+        stream = b.stream.EditCode(
+            [],
+            "make the button red",
+            [],
+            "{}",
+            baml_options={
+                "collector": collector,
+                "client_registry": local_registry(route),
+            },
+        )
+        async for _ in stream:
+            pass
+        return await stream.get_final_response()
+
+    result = asyncio.run(main())
+    usage = usage_from_collector(collector, generation_seconds=1.0, ttft=0.25)
+
+    assert result.edits[0].hunks[0].replace == "bg-red-600"
+    # OpenAI only reports usage on streams when asked to
+    assert ReplayHandler.requests[-1]["stream_options"] == {"include_usage": True}
+    assert usage.input_tokens == 2210
+    assert usage.output_tokens == 96
+    assert usage.cached_input_tokens == 1536
+    assert usage.cached_ratio == pytest.approx(1536 / 2210)
+    assert usage.ttft == 0.25
+
+
+def test_sandbox_usage_totals():
+    totals = SandboxUsage(max_sandboxes=2)
+    totals.add("a", TokenUsage(calls=1, output_tokens=100, ttft=0.4))
+    totals.add("b", TokenUsage(calls=1, output_tokens=50, ttft=0.2))
+    totals.add("a", TokenUsage(calls=1, output_tokens=20, ttft=0.6))
+
+    assert totals.get("a").output_tokens == 120
+    assert totals.get("a").mean_ttft == pytest.approx(0.5)
+    assert totals.get("a").to_dict()["mean_ttft"] == 0.5
+
+    # "b" is the least recently used sandbox
+    totals.add("c", TokenUsage(calls=1))
+    assert "b" not in totals
+    assert len(totals) == 2
+    assert totals.get("b") == TokenUsage()
@@ -0,0 +1,147 @@
+"""
+Search/replace hunks: each must match the file exactly once, and a file whose
+hunks don't apply falls back to a whole-file rewrite.
+
+Run from the repo root with `python -m pytest tests`.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.patch import PatchError, _find_lines, apply_hunks
+
+BUTTON = """\
+export function Button() {
+  return (
+    <button className="bg-blue-600 text-white">
+      Save
+    </button>
+  );
+}
+"""
+
+
+def hunk(search: str, replace: str) -> dict:
+    return {"search": search, "replace": replace}
+
+
+def test_unique_match():
+    patched = apply_hunks(BUTTON, [hunk("bg-blue-600", "bg-red-600")])
+    assert patched == BUTTON.replace("bg-blue-600", "bg-red-600")
+
+
+def test_ambiguous_match_is_rejected():
+    content = BUTTON + BUTTON.replace("Button", "OtherButton")
+    with pytest.raises(PatchError, match="matches 2 times"):
+        apply_hunks(content, [hunk("bg-blue-600", "bg-red-600")])
+
+
+def test_ambiguous_line_match_is_rejected():
+    # No exact match, and two matches once trailing whitespace is ignored
+    content = "<p>Save</p>  \n<p>Save</p>\t\n"
+    assert _find_lines(content, "<p>Save</p>\n") is None
+    with pytest.raises(PatchError, match="does not match"):
+        apply_hunks(content, [hunk("<p>Save</p>\n", "<p>Send</p>\n")])
+
+
+def test_whitespace_tolerant_match():
+    # The file has trailing whitespace the model's search block doesn't
+    content = BUTTON.replace("      Save\n", "      Save   \n")
+    search = '    <button className="bg-blue-600 text-white">\n      Save\n'
+    replace = '    <button className="bg-red-600 text-white">\n      Send\n'
+
+    patched = apply_hunks(content, [hunk(search, replace)])
+
+    assert patched == BUTTON.replace(search, replace)
+
+
+def test_missing_search_raises():
+    with pytest.raises(PatchError, match="does not match"):
+        apply_hunks(BUTTON, [hunk("bg-green-600", "bg-red-600")])
+
+
+def test_several_hunks_in_one_file():
+    patched = apply_hunks(
+        BUTTON,
+        [
+            hunk("bg-blue-600", "bg-red-600"),
+            hunk("Save", "Send"),
+            # Later hunks see the earlier ones' result
+            hunk('"bg-red-600 text-white"', '"bg-red-600 text-white rounded-md"'),
+        ],
+    )
+    assert patched == BUTTON.replace(
+        '"bg-blue-600 text-white"', '"bg-red-600 text-white rounded-md"'
+    ).replace("Save", "Send")
+
+
+class FakeStream:
+    """EditCode's stream for a turn that edits Button.tsx with a stale hunk"""
+
+    def __init__(self, edits):
+        self.edits = edits
+
+    async def __aiter__(self):
+        yield SimpleNamespace(
+            plan=SimpleNamespace(value="Make it red.", state="Complete"),
+            files=[],
+            edits=self.edits,
+        )
+
+
+def test_unapplied_hunks_fall_back_to_a_rewrite(monkeypatch):
+    pytest.importorskip("baml_py")
+    pytest.importorskip("beam")
+    from baml_client.types import File, FileEdit, Hunk
+    from src import agent as agent_module
+
+    path = "/app/src/components/Button.tsx"
+    rewritten = BUTTON.replace("bg-blue-600", "bg-red-600")
+    # The hunk was written against a file that no longer says green
+    edit = FileEdit(
+        path=path, hunks=[Hunk(search="bg-green-600", replace="bg-red-600")]
+    )
+    calls = SimpleNamespace(patched={}, written={}, rewrite_paths=[])
+
+    async def edit_code(_history, _feedback, code_files, _package_json, **_kwargs):
+        calls.rewrite_paths = [f["path"] for f in code_files]
+        return SimpleNamespace(files=[File(path=path, content=rewritten)])
+
+    async def get_code(_sandbox_id):
+        return {path: BUTTON}, "{}"
+
+    async def patch_code(_sandbox_id, edits):
+        # What the patch_code tool reports for hunks that don't apply
+        failed = {}
+        for file_path, hunks in edits.items():
+            try:
+                calls.patched[file_path] = apply_hunks(BUTTON, hunks)
+            except PatchError as e:
+                failed[file_path] = str(e)
+        return {"files": {}, "failed": failed, "version": "v2"}
+
+    async def write_code(_sandbox_id, code_map):
+        calls.written.update(code_map)
+
+    monkeypatch.setattr(agent_module, "client_registry", lambda _route: None)
+    agent = agent_module.Agent(mcp_url=None, session_id="session")
+    agent.init_data = {"sandbox_id": "default"}
+    stream = SimpleNamespace(EditCode=lambda *_args, **_kwargs: FakeStream([edit]))
+    agent.model_client = SimpleNamespace(stream=stream, EditCode=edit_code)
+    monkeypatch.setattr(agent, "get_code", get_code)
+    monkeypatch.setattr(agent, "patch_code", patch_code)
+    monkeypatch.setattr(agent, "write_code", write_code)
+
+    async def main():
+        return [message async for message in agent.send_feedback("make it red")]
+
+    messages = asyncio.run(asyncio.wait_for(main(), timeout=10))
+
+    assert calls.patched == {}
+    assert calls.rewrite_paths == [path]
+    assert calls.written == {path: rewritten}
+    assert any(
+        message["data"].get("text") == f"Rewriting {path}" for message in messages
+    )
+    assert messages[-1]["type"] == agent_module.MessageType.UPDATE_COMPLETED.value
@@ -0,0 +1,109 @@
+import pytest
+
+pytest.importorskip("baml_py")
+
+from src.context import (
+    CONTEXT_TOKEN_BUDGET,
+    ImportGraph,
+    edit_targets,
+    estimate_tokens,
+    select_context,
+)
+from src.router import MAX_FAST_TARGET_TOKENS, route_edit
+
+SMALL_TARGETS = 2_000
+
+
+@pytest.mark.parametrize(
+    "feedback, route",
+    [
+        ("make the button red", "fast"),
+        ("make the header blue", "fast"),
+        ("make the title bold", "fast"),
+        ("give the cards rounded corners and a shadow", "fast"),
+        ("change the submit label to Send", "fast"),
+        ("fix the typo in the footer", "fast"),
+        ("build a full dashboard", "strong"),
+        ("create a new settings page with routing", "strong"),
+        ("add authentication with a login page", "strong"),
+        ("refactor the state management", "strong"),
+    ],
+)
+def test_route_by_feedback(feedback, route):
+    result = route_edit(
+        feedback, target_tokens=SMALL_TARGETS, target_count=1, has_history=True
+    )
+    assert result.name == route, result.reason
+
+
+@pytest.mark.parametrize(
+    "kwargs, reason",
+    [
+        (
+            {"target_tokens": SMALL_TARGETS, "target_count": 1, "has_history": False},
+            "first turn",
+        ),
+        (
+            {
+                "target_tokens": MAX_FAST_TARGET_TOKENS + 1,
+                "target_count": 1,
+                "has_history": True,
+            },
+            "tokens",
+        ),
+        (
+            {"target_tokens": SMALL_TARGETS, "target_count": 10, "has_history": True},
+            "10 edit targets",
+        ),
+    ],
+)
+def test_small_edits_with_large_scope_stay_strong(kwargs, reason):
+    result = route_edit("make the button red", **kwargs)
+    assert result.name == "strong"
+    assert reason in result.reason
+
+
+def source(imports: list[str], size: int) -> str:
+    lines = [f'import {{ X{i} }} from "@/{spec}";' for i, spec in enumerate(imports)]
+    lines += ["", "export function Component() {", "  return ("]
+    while sum(map(len, lines)) < size:
+        lines.append('    <div className="flex items-center gap-2">{label}</div>')
+    lines += ["  );", "}"]
+    return "\n".join(lines)
+
+
+# A small app whose import graph holds more than the context budget
+PROJECT = {
+    "/app/src/App.tsx": source(["pages/Home", "pages/Dashboard"], 1_500),
+    "/app/src/pages/Home.tsx": source(["components/Header"], 3_000),
+    "/app/src/pages/Dashboard.tsx": source(
+        ["components/ui/sidebar", "components/ui/chart", "components/ui/table"], 3_000
+    ),
+    "/app/src/components/Header.tsx": source(["components/ui/button"], 2_500),
+    "/app/src/components/ui/button.tsx": source([], 1_900),
+    "/app/src/components/ui/sidebar.tsx": source([], 40_000),
+    "/app/src/components/ui/chart.tsx": source([], 30_000),
+    "/app/src/components/ui/table.tsx": source([], 28_000),
+}
+
+
+@pytest.mark.parametrize("feedback", ["make the button red", "make it red"])
+def test_route_with_selected_context(feedback):
+    graph = ImportGraph()
+    graph.sync(PROJECT)
+    targets = edit_targets(PROJECT, feedback)
+    context_map = select_context(graph, PROJECT, targets)
+
+    result = route_edit(
+        feedback,
+        target_tokens=sum(estimate_tokens(PROJECT[path]) for path in targets),
+        target_count=len(targets),
+        has_history=True,
+    )
+
+    assert result.name == "fast", result.reason
+    if targets == ["/app/src/App.tsx"]:
+        # The entry point pulls in a near-budget context; only the target counts
+        context_tokens = sum(map(estimate_tokens, context_map.values()))
+        assert context_tokens > MAX_FAST_TARGET_TOKENS
+        assert context_tokens <= CONTEXT_TOKEN_BUDGET
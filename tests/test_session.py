@@ -0,0 +1,66 @@
+"""
+The session registry caps the bytes its sessions hold, code snapshots
+included, not only how many sessions it keeps.
+
+Run from the repo root with `python -m pytest tests`.
+"""
+from src.context import ImportGraph
+from src.session import SessionRegistry
+from src.snapshot import CodeSnapshot
+
+
+class FakeAgent:
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.bytes = 0
+
+    def memory_bytes(self) -> int:
+        return self.bytes
+
+
+def test_evicts_least_recently_used_sessions_over_the_byte_cap():
+    sessions = SessionRegistry(FakeAgent, max_sessions=10, max_bytes=1000)
+    for session_id in "abc":
+        sessions.get(session_id).bytes = 400
+    sessions.get("a")
+
+    # Looking up a session that grew over the cap evicts the oldest others
+    sessions.get("d").bytes = 300
+    sessions.get("d")
+
+    assert "b" not in sessions
+    assert "c" not in sessions
+    assert "a" in sessions
+    assert sessions.size() == 700
+
+
+def test_keeps_the_current_session_even_over_the_byte_cap():
+    sessions = SessionRegistry(FakeAgent, max_bytes=1000)
+    sessions.get("a").bytes = 100
+    sessions.get("b").bytes = 5000
+    sessions.get("b")
+
+    assert "a" not in sessions
+    assert "b" in sessions
+
+
+def test_snapshot_size_follows_loads_and_writes():
+    snapshot = CodeSnapshot.new(
+        "sandbox",
+        "v1",
+        {"files": {"/a.tsx": "a" * 100, "/b.tsx": "é" * 50}, "package_json": "{}"},
+    )
+    assert snapshot.size() == 100 + 100 + 2
+
+    snapshot.update({"/a.tsx": "a" * 10})
+    snapshot.apply_load("v2", {"deleted": ["/b.tsx"]})
+    assert snapshot.size() == 10 + 2
+
+
+def test_import_graph_size():
+    graph = ImportGraph()
+    graph.sync({"/app/src/App.tsx": 'import { X } from "@/pages/Home";'})
+    assert graph.size() > len("/app/src/App.tsx") + len("@/pages/Home")
+
+    graph.sync({})
+    assert graph.size() == 0
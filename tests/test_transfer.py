@@ -0,0 +1,70 @@
+"""
+Transfers staged in tmpfs fall back to disk when tmpfs runs out of space.
+
+Run from the repo root with `python -m pytest tests`.
+"""
+import errno
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src import transfer
+
+
+class FakeFs:
+    """A sandbox filesystem; staging files in `full_dir` fails with ENOSPC"""
+
+    def __init__(self, full_dir: Path):
+        self.full_dir = full_dir
+        self.files: dict[str, bytes] = {}
+        self.staged_in: list[str] = []
+
+    def _check(self, local_path: str):
+        self.staged_in.append(os.path.dirname(local_path))
+        if Path(local_path).parent == self.full_dir:
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+    def upload_file(self, local_path: str, sandbox_path: str):
+        self._check(local_path)
+        self.files[sandbox_path] = Path(local_path).read_bytes()
+
+    def download_file(self, sandbox_path: str, local_path: str):
+        self._check(local_path)
+        Path(local_path).write_bytes(self.files[sandbox_path])
+
+
+@pytest.fixture
+def sandbox(monkeypatch, tmp_path):
+    memory_dir = tmp_path / "shm"
+    memory_dir.mkdir()
+    monkeypatch.setattr(transfer, "MEMORY_DIR", str(memory_dir))
+    return SimpleNamespace(fs=FakeFs(full_dir=memory_dir))
+
+
+def test_upload_falls_back_to_disk_when_tmpfs_is_full(sandbox):
+    transfer.upload_bytes(sandbox, b"export default App;", "/app/src/main.tsx")
+
+    assert sandbox.fs.files["/app/src/main.tsx"] == b"export default App;"
+    assert sandbox.fs.staged_in[0] == transfer.MEMORY_DIR
+    assert sandbox.fs.staged_in[1] != transfer.MEMORY_DIR
+
+
+def test_download_falls_back_to_disk_when_tmpfs_is_full(sandbox):
+    sandbox.fs.files["/app/src/main.tsx"] = b"export default App;"
+
+    assert transfer.download_bytes(sandbox, "/app/src/main.tsx") == (
+        b"export default App;"
+    )
+    assert sandbox.fs.staged_in[0] == transfer.MEMORY_DIR
+    assert sandbox.fs.staged_in[1] != transfer.MEMORY_DIR
+
+
+def test_other_errors_are_not_retried(sandbox):
+    def fail(_local_path, _sandbox_path):
+        raise OSError(errno.EACCES, "Permission denied")
+
+    sandbox.fs.upload_file = fail
+    with pytest.raises(PermissionError):
+        transfer.upload_bytes(sandbox, b"data", "/app/src/main.tsx")